@@ -1,23 +1,74 @@
-import re
-from nltk import CFG, ChartParser
+import importlib
+import importlib.util
+import os
+import sys
+
+import BatchCheck
+from CompiledGrammar import compileGrammar
+
+# tokenize korzysta z pakietu automata z katalogu src/ obok Grammars/
+AUTOMATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "automata")
+
+_lexer = None
+
+def _importLexer():
+    # automata.Lexer z zainstalowanego pakietu albo ze sciezki; gdy go tam nie ma - pakiet
+    # z AUTOMATA ladowany po polozeniu pliku, bez zmiany sys.path
+    try:
+        return importlib.import_module("automata.Lexer")
+    except ModuleNotFoundError as error:
+        if error.name != "automata":
+            raise
+    spec = importlib.util.spec_from_file_location("automata", os.path.join(AUTOMATA, "__init__.py"),
+                                                  submodule_search_locations=[AUTOMATA])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["automata"] = package
+    try:
+        spec.loader.exec_module(package)
+    except BaseException:
+        del sys.modules["automata"]
+        raise
+    return importlib.import_module("automata.Lexer")
+
+def _getLexer():
+    # lekser budowany przy pierwszym uzyciu; klasy tokenow nazwane jak terminale gramatyki,
+    # liczby od razu jako 'NUM'
+    global _lexer
+    if _lexer is None:
+        lexer = _importLexer()
+        one_of, one_or_more = lexer.one_of, lexer.one_or_more
+        _lexer = lexer.Lexer([
+            ("NUM", one_or_more("0123456789")),
+            ("+", one_of("+")),
+            ("*", one_of("*")),
+            ("(", one_of("(")),
+            (")", one_of(")")),
+            ("-", one_of("-")),
+            ("WS", one_or_more(" \t\r\n")),
+        ], skip=["WS"])
+    return _lexer
+
+def tokenize(sentence):
+    # jeden przebieg DFA leksera (najdluzsze dopasowanie); LexerError (ValueError) z pozycja
+    # nierozpoznanego znaku
+    return _getLexer().token_names(sentence)
 
 def preprocess(sentence):
-    tokens = re.findall(r'\d+|[+*()\-]', sentence)
-    processed_tokens = ['NUM' if re.fullmatch(r'\d+', token) else token for token in tokens]
-    return " ".join(processed_tokens)
-
-def canGenerateByCFG(grammar_str, sentence):
-    grammar = CFG.fromstring(grammar_str)
-    parser = ChartParser(grammar)
-    # tokenizacja i zamiana liczb na 'NUM'
-    processed = preprocess(sentence)
-    tokens = processed.split()
+    return " ".join(tokenize(sentence))
+
+def canGenerateByCFG(grammar, sentence, engine="native"):
+    # grammar to tekst gramatyki albo gramatyka skompilowana przez compileGrammar (raz na gramatyke);
+    # engine="nltk" sprawdza zdanie ChartParserem NLTK zamiast wbudowanego CYK
+    compiled = compileGrammar(grammar, engine)
     try:
-        parses = list(parser.parse(tokens))
-        return bool(parses)
+        return compiled.recognizes(tokenize(sentence))
     except ValueError:
         return False
 
+def checkSentences(grammar_str, sentences, workers=None, engine="native"):
+    # wsadowe sprawdzanie zdan w puli procesow, wyniki w kolejnosci zdan
+    return BatchCheck.checkSentences(grammar_str, sentences, workers, tokenize, engine)
+
 def readGrammar(file):
     with open(file, "r", encoding="utf-8") as f:
         return f.read()
@@ -32,12 +83,10 @@ def readSentence(file):
 
 
 if __name__ == '__main__':
-
     grammar = readGrammar("grammar_arithmetics.txt")
     sentences = readSentences("sentences_arithmetics.txt")
 
     iterator = 0
-    for sentence in sentences:
+    for sentence, result in zip(sentences, checkSentences(grammar, sentences)):
         iterator += 1
-        result = canGenerateByCFG(grammar, sentence)
         print(f"{iterator}. {result}  <->  {sentence}")
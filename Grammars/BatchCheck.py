@@ -0,0 +1,35 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from CompiledGrammar import compileGrammar
+
+MIN_PARALLEL = 2000  # ponizej tylu zdan pula procesow sie nie oplaca
+
+_worker = None  # (gramatyka, tokenizacja) ustawiane raz w kazdym procesie roboczym
+
+def _initWorker(grammar_str, engine, tokenize):
+    global _worker
+    _worker = (compileGrammar(grammar_str, engine), tokenize)
+
+def _checkSentence(sentence):
+    compiled, tokenize = _worker
+    try:
+        return compiled.recognizes(tokenize(sentence))
+    except ValueError:
+        return False
+
+def checkSentences(grammar_str, sentences, workers=None, tokenize=str.split, engine="native", chunksize=None):
+    # sprawdza zdania pula procesow: kazdy proces kompiluje gramatyke raz (initializer) i dostaje
+    # zdania porcjami; wyniki wracaja w kolejnosci wejscia. tokenize musi byc funkcja modulu
+    # (przekazywana do procesow). Dla malych wejsc lub workers=1 liczy w biezacym procesie.
+    sentences = list(sentences)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(sentences) < MIN_PARALLEL:
+        _initWorker(grammar_str, engine, tokenize)
+        return [_checkSentence(sentence) for sentence in sentences]
+    if chunksize is None:
+        chunksize = max(1, min(10000, len(sentences) // (workers * 8)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker,
+                             initargs=(grammar_str, engine, tokenize)) as pool:
+        return list(pool.map(_checkSentence, sentences, chunksize=chunksize))
@@ -0,0 +1,45 @@
+import hashlib
+from collections import OrderedDict
+
+from NativeGrammar import NativeGrammar
+
+CACHE_SIZE = 32  # ile skompilowanych gramatyk trzymac w pamieci
+
+class CompiledGrammar:
+    # gramatyka NLTK sparsowana raz razem z parserem, do wielokrotnego uzycia;
+    # NLTK importowany dopiero tutaj, bo domyslny silnik (NativeGrammar) go nie potrzebuje
+    def __init__(self, grammar_str):
+        from nltk import CFG, ChartParser
+        self.grammar = CFG.fromstring(grammar_str)
+        self.parser = ChartParser(self.grammar)
+
+    def recognizes(self, tokens):
+        # samo rozpoznanie bez budowania drzew: wykres parsera ma wielomianowy rozmiar,
+        # a wystarczy pierwsza pelna krawedz symbolu startowego rozpinajaca cale zdanie;
+        # ValueError gdy tokenow nie ma w gramatyce (jak w ChartParser.parse)
+        chart = self.parser.chart_parse(tokens)
+        complete = chart.select(start=0, end=len(tokens), lhs=self.grammar.start(), is_complete=True)
+        return next(iter(complete), None) is not None
+
+_cache = OrderedDict()
+
+ENGINES = {"native": NativeGrammar, "nltk": CompiledGrammar}
+
+def compileGrammar(grammar, engine="native"):
+    # zwraca skompilowana gramatyke z ograniczonej pamieci podrecznej (LRU), kluczem jest skrot tekstu
+    # gramatyki i silnik: "native" (CYK bez NLTK) albo "nltk" (ChartParser);
+    # skompilowana gramatyka przekazana jako argument jest zwracana bez zmian
+    if isinstance(grammar, (NativeGrammar, CompiledGrammar)):
+        return grammar
+    key = (engine, hashlib.sha256(grammar.encode("utf-8")).hexdigest())
+    compiled = _cache.get(key)
+    if compiled is not None:
+        _cache.move_to_end(key)
+        return compiled
+    compiled = _cache[key] = ENGINES[engine](grammar)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return compiled
+
+def clearGrammarCache():
+    _cache.clear()
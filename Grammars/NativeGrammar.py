@@ -0,0 +1,287 @@
+import re
+
+# rozpoznawanie bez NLTK: gramatyka w formacie plikow grammar_*.txt zamieniana jest na postac
+# normalna Chomsky'ego i sprawdzana algorytmem CYK (komorki tablicy to maski bitowe
+# nieterminali); dla gramatyki w oryginalnej postaci jest tez rozpoznawanie Earleya
+
+TOKEN = re.compile(r'''\s*(?:(->)|(\|)|"([^"]*)"|'([^']*)'|([^\s|"']+))''')
+
+def parseGrammar(grammar_str):
+    # zwraca (symbol startowy, lista regul (lewa strona, krotka prawej strony));
+    # terminale w prawej stronie to krotki ('t', tekst), nieterminale to napisy
+    rules = []
+    start = None
+    for line_number, line in enumerate(grammar_str.splitlines(), 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        position = 0
+        symbols = []
+        while position < len(line):
+            match = TOKEN.match(line, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"linia {line_number}: nie mozna odczytac '{line[position:].strip()}'")
+            position = match.end()
+            arrow, bar, double_quoted, single_quoted, name = match.groups()
+            if arrow:
+                symbols.append('->')
+            elif bar:
+                symbols.append('|')
+            elif double_quoted is not None:
+                symbols.append(('t', double_quoted))
+            elif single_quoted is not None:
+                symbols.append(('t', single_quoted))
+            else:
+                symbols.append(name)
+        if len(symbols) < 2 or symbols[1] != '->' or not isinstance(symbols[0], str) or symbols[0] in ('->', '|'):
+            raise ValueError(f"linia {line_number}: oczekiwano 'Nieterminal -> ...'")
+        lhs = symbols[0]
+        if start is None:
+            start = lhs
+        alternative = []
+        for symbol in symbols[2:] + ['|']:
+            if symbol == '|':
+                rules.append((lhs, tuple(alternative)))
+                alternative = []
+            elif symbol == '->':
+                raise ValueError(f"linia {line_number}: podwojna strzalka")
+            else:
+                alternative.append(symbol)
+    if start is None:
+        raise ValueError("gramatyka jest pusta")
+    return start, rules
+
+def _nullable(rules):
+    nullable = set()
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in rules:
+            if lhs not in nullable and all(symbol in nullable for symbol in rhs):
+                nullable.add(lhs)
+                changed = True
+    return nullable
+
+def toCNF(start, rules):
+    # START, TERM, BIN, DEL, UNIT; zwraca (nowy start, czy start jest wymazywalny,
+    # reguly A -> 'a', reguly A -> B C)
+    # nazwy pomocniczych nieterminali zawieraja znaki, ktorych nie ma w nazwach z pliku
+    new_start = start + "'"
+    rules = [(new_start, (start,))] + list(rules)
+
+    # TERM: terminale w regulach dlugosci >= 2 zastepowane nieterminalem "'terminal'"
+    terminal_names = {}
+    term_rules = []
+    for lhs, rhs in rules:
+        if len(rhs) < 2:
+            term_rules.append((lhs, rhs))
+            continue
+        new_rhs = []
+        for symbol in rhs:
+            if isinstance(symbol, tuple):
+                if symbol not in terminal_names:
+                    terminal_names[symbol] = f"'{symbol[1]}'"
+                    term_rules.append((terminal_names[symbol], (symbol,)))
+                symbol = terminal_names[symbol]
+            new_rhs.append(symbol)
+        term_rules.append((lhs, tuple(new_rhs)))
+
+    # BIN: A -> X1 X2 ... Xn zamieniane na lancuch regul dwuelementowych
+    binary_rules = []
+    counter = 0
+    for lhs, rhs in term_rules:
+        while len(rhs) > 2:
+            counter += 1
+            helper = f"{lhs} {counter}"
+            binary_rules.append((lhs, (rhs[0], helper)))
+            lhs, rhs = helper, rhs[1:]
+        binary_rules.append((lhs, rhs))
+
+    # DEL: usuniecie regul pustych (wymazywalnosc startu pamietana osobno)
+    nullable = _nullable(binary_rules)
+    without_empty = set()
+    for lhs, rhs in binary_rules:
+        if len(rhs) == 2:
+            first, second = rhs
+            without_empty.add((lhs, rhs))
+            if first in nullable:
+                without_empty.add((lhs, (second,)))
+            if second in nullable:
+                without_empty.add((lhs, (first,)))
+        elif len(rhs) == 1:
+            without_empty.add((lhs, rhs))
+
+    # UNIT: A -> B zastepowane regulami B (domkniecie relacji jednostkowej)
+    unit = {}
+    for lhs, rhs in without_empty:
+        if len(rhs) == 1 and isinstance(rhs[0], str):
+            unit.setdefault(lhs, set()).add(rhs[0])
+    non_unit = {}
+    for lhs, rhs in without_empty:
+        if not (len(rhs) == 1 and isinstance(rhs[0], str)):
+            non_unit.setdefault(lhs, set()).add(rhs)
+    nonterminals = {lhs for lhs, _ in without_empty} | {symbol for _, rhs in without_empty
+                                                         for symbol in rhs if isinstance(symbol, str)}
+    terminal_rules = set()
+    pair_rules = set()
+    for lhs in nonterminals:
+        reachable = {lhs}
+        stack = [lhs]
+        while stack:
+            for target in unit.get(stack.pop(), ()):
+                if target not in reachable:
+                    reachable.add(target)
+                    stack.append(target)
+        for source in reachable:
+            for rhs in non_unit.get(source, ()):
+                if len(rhs) == 1:
+                    terminal_rules.add((lhs, rhs[0][1]))
+                else:
+                    pair_rules.add((lhs, rhs))
+    return new_start, new_start in nullable, sorted(terminal_rules), sorted(pair_rules)
+
+class NativeGrammar:
+    def __init__(self, grammar_str):
+        self.start, self.rules = parseGrammar(grammar_str)
+        self._prepareCYK()
+        self._prepareEarley()
+
+    def _prepareCYK(self):
+        start, self.start_nullable, terminal_rules, pair_rules = toCNF(self.start, self.rules)
+        names = sorted({lhs for lhs, _ in terminal_rules} | {lhs for lhs, _ in pair_rules}
+                       | {symbol for _, rhs in pair_rules for symbol in rhs} | {start})
+        ids = {name: i for i, name in enumerate(names)}
+        self.cnf_start_bit = 1 << ids[start]
+
+        # terminal -> maska nieterminali A z regula A -> terminal
+        self.terminal_masks = {}
+        for lhs, terminal in terminal_rules:
+            self.terminal_masks[terminal] = self.terminal_masks.get(terminal, 0) | 1 << ids[lhs]
+        # B -> [(C, maska A z regula A -> B C)]
+        by_left = {}
+        for lhs, (left, right) in pair_rules:
+            by_left.setdefault(ids[left], {}).setdefault(ids[right], 0)
+            by_left[ids[left]][ids[right]] |= 1 << ids[lhs]
+        self.by_left = {left: list(rights.items()) for left, rights in by_left.items()}
+        self._pairs = {}  # (maska lewa, maska prawa) -> maska wyniku
+
+    def _combine(self, left, right):
+        key = (left, right)
+        result = self._pairs.get(key)
+        if result is not None:
+            return result
+        result = 0
+        by_left = self.by_left
+        while left:
+            lowest = left & -left
+            for right_symbol, mask in by_left.get(lowest.bit_length() - 1, ()):
+                if right >> right_symbol & 1:
+                    result |= mask
+            left ^= lowest
+        if len(self._pairs) > 100000:
+            self._pairs.clear()
+        self._pairs[key] = result
+        return result
+
+    def cyk(self, tokens):
+        n = len(tokens)
+        if n == 0:
+            return self.start_nullable
+        # table[length][i] - maska nieterminali wyprowadzajacych tokens[i:i+length]
+        table = [None, []]
+        for token in tokens:
+            mask = self.terminal_masks.get(token, 0)
+            if not mask:
+                return False
+            table[1].append(mask)
+        combine = self._combine
+        for length in range(2, n + 1):
+            row = []
+            for i in range(n - length + 1):
+                cell = 0
+                for split in range(1, length):
+                    left = table[split][i]
+                    if left:
+                        right = table[length - split][i + split]
+                        if right:
+                            cell |= combine(left, right)
+                row.append(cell)
+            table.append(row)
+        return bool(table[n][0] & self.cnf_start_bit)
+
+    def _prepareEarley(self):
+        # reguly oryginalnej gramatyki z rozszerzonym startem; symbole kodowane int-ami:
+        # nieterminale >= 0, terminale jako ~id (ujemne)
+        nonterminals = [self.start] + sorted({lhs for lhs, _ in self.rules} - {self.start})
+        nonterminal_ids = {name: i for i, name in enumerate(nonterminals)}
+        terminal_ids = {}
+        rules = [(-1, (0,))]  # rozszerzony start: S' -> S
+        for lhs, rhs in self.rules:
+            coded = []
+            for symbol in rhs:
+                if isinstance(symbol, tuple):
+                    coded.append(~terminal_ids.setdefault(symbol[1], len(terminal_ids)))
+                elif symbol in nonterminal_ids:
+                    coded.append(nonterminal_ids[symbol])
+                else:
+                    # nieterminal bez regul - nigdy nic nie wyprowadza
+                    nonterminal_ids[symbol] = len(nonterminals)
+                    nonterminals.append(symbol)
+                    coded.append(nonterminal_ids[symbol])
+            rules.append((nonterminal_ids[lhs], tuple(coded)))
+        self.earley_rules = rules
+        self.terminal_ids = terminal_ids
+        self.rules_of = [[] for _ in nonterminals]
+        for index, (lhs, _) in enumerate(rules):
+            if lhs >= 0:
+                self.rules_of[lhs].append(index)
+        self.nullable_ids = {nonterminal_ids[name] for name in _nullable(self.rules) if name in nonterminal_ids}
+
+    def earley(self, tokens):
+        rules = self.earley_rules
+        rules_of = self.rules_of
+        nullable = self.nullable_ids
+        coded = []
+        for token in tokens:
+            terminal = self.terminal_ids.get(token)
+            if terminal is None:
+                return False
+            coded.append(~terminal)
+
+        sets = [[] for _ in range(len(coded) + 1)]
+        seen = [set() for _ in range(len(coded) + 1)]
+        # waiting[k][B] - elementy zbioru k z kropka przed nieterminalem B
+        waiting = [{} for _ in range(len(coded) + 1)]
+
+        def add(position, item):
+            if item not in seen[position]:
+                seen[position].add(item)
+                sets[position].append(item)
+
+        add(0, (0, 0, 0))
+        for position in range(len(coded) + 1):
+            items = sets[position]
+            i = 0
+            while i < len(items):
+                rule, dot, origin = items[i]
+                i += 1
+                lhs, rhs = rules[rule]
+                if dot < len(rhs):
+                    symbol = rhs[dot]
+                    if symbol >= 0:
+                        # predykcja, z przeskokiem symboli wymazywalnych (Aycock-Horspool)
+                        waiting[position].setdefault(symbol, []).append((rule, dot, origin))
+                        for predicted in rules_of[symbol]:
+                            add(position, (predicted, 0, position))
+                        if symbol in nullable:
+                            add(position, (rule, dot + 1, origin))
+                    elif position < len(coded) and coded[position] == symbol:
+                        add(position + 1, (rule, dot + 1, origin))
+                elif origin != position:
+                    # uzupelnienie; reguly puste (origin == position) obsluguje przeskok wymazywalnych
+                    for waiting_rule, waiting_dot, waiting_origin in waiting[origin].get(lhs, ()):
+                        add(position, (waiting_rule, waiting_dot + 1, waiting_origin))
+        return (0, 1, 0) in seen[len(coded)]
+
+    def recognizes(self, tokens):
+        return self.cyk(tokens)
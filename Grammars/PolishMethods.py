@@ -1,15 +1,20 @@
-from nltk import CFG, ChartParser
+import BatchCheck
+from CompiledGrammar import compileGrammar
 
-def canGenerateByCFG(grammar_str, sentence):
-    grammar = CFG.fromstring(grammar_str)
-    parser = ChartParser(grammar)
+def canGenerateByCFG(grammar, sentence, engine="native"):
+    # grammar to tekst gramatyki albo gramatyka skompilowana przez compileGrammar (raz na gramatyke);
+    # engine="nltk" sprawdza zdanie ChartParserem NLTK zamiast wbudowanego CYK
+    compiled = compileGrammar(grammar, engine)
     sentence = sentence.split()
     try:
-        parses = list(parser.parse(sentence))
-        return bool(parses)
+        return compiled.recognizes(sentence)
     except ValueError:
         return False
 
+def checkSentences(grammar_str, sentences, workers=None, engine="native"):
+    # wsadowe sprawdzanie zdan w puli procesow, wyniki w kolejnosci zdan
+    return BatchCheck.checkSentences(grammar_str, sentences, workers, engine=engine)
+
 def readGrammar(file):
     with open(file, "r", encoding="utf-8") as f:
         return f.read()
@@ -23,6 +28,6 @@ if __name__ == '__main__':
     grammar = readGrammar("grammar_polish.txt")
     sentences = readSentences("sentences_polish.txt")
     iterator = 0
-    for sentence in sentences:
+    for sentence, result in zip(sentences, checkSentences(grammar, sentences)):
         iterator += 1
-        print(f"{iterator}. {canGenerateByCFG(grammar, sentence)}  <->  {sentence}")
+        print(f"{iterator}. {result}  <->  {sentence}")
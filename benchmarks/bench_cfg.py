@@ -0,0 +1,68 @@
+"""
+Przepustowosc rozpoznawania zdan: wbudowany CYK / Earley (NativeGrammar) vs ChartParser NLTK.
+
+Uruchomienie (z katalogu glownego repozytorium):
+    python benchmarks/bench_cfg.py [powtorzenia]
+"""
+import os
+import sys
+import time
+
+GRAMMARS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Grammars")
+sys.path.insert(0, GRAMMARS)
+
+from ArithmeticsMethods import preprocess, readGrammar, readSentences
+from NativeGrammar import NativeGrammar
+
+
+def nltk_recognizer(grammar_str):
+    try:
+        from CompiledGrammar import CompiledGrammar
+        compiled = CompiledGrammar(grammar_str)
+    except ImportError:
+        return None
+
+    def recognizes(tokens):
+        try:
+            return compiled.recognizes(tokens)
+        except ValueError:
+            return False
+    return recognizes
+
+
+def workload(name, tokenize):
+    grammar = readGrammar(os.path.join(GRAMMARS, f"grammar_{name}.txt"))
+    sentences = [tokenize(sentence) for sentence in readSentences(os.path.join(GRAMMARS, f"sentences_{name}.txt"))]
+    return grammar, sentences
+
+
+def measure(recognizes, sentences, repeat):
+    start = time.perf_counter()
+    results = None
+    for _ in range(repeat):
+        results = [recognizes(tokens) for tokens in sentences]
+    return time.perf_counter() - start, results
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for name, tokenize in (("arithmetics", lambda sentence: preprocess(sentence).split()),
+                           ("polish", str.split)):
+        grammar, sentences = workload(name, tokenize)
+        native = NativeGrammar(grammar)
+        engines = [("CYK", native.cyk), ("Earley", native.earley)]
+        reference = nltk_recognizer(grammar)
+        if reference is not None:
+            engines.append(("NLTK", reference))
+
+        expected = None
+        for engine, recognizes in engines:
+            elapsed, results = measure(recognizes, sentences, repeat)
+            if expected is None:
+                expected = results
+            assert results == expected, f"{engine} daje inne wyniki niz CYK"
+            print(f"{name:12s} {engine:7s} {repeat * len(sentences) / elapsed:10.0f} zdan/s")
+
+
+if __name__ == '__main__':
+    main()
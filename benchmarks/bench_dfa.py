@@ -0,0 +1,76 @@
+"""
+Porownanie przepustowosci DFA.accepts: sciezka slownikowa vs skompilowana tablica.
+
+Uruchomienie (z katalogu glownego repozytorium):
+    python benchmarks/bench_dfa.py [liczba_napisow]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from automata import DFA
+
+
+def postal_code_automaton():
+    # automat kodow pocztowych DD-DDD, taki sam jak w dfa_kody_pocztowe.txt
+    dfa = DFA()
+    for _ in range(7):
+        dfa.add_state()
+    dfa.mark_as_initial(0)
+    dfa.mark_as_final(6)
+    for state in range(6):
+        if state == 2:
+            dfa.add_transition(2, "-", 3)
+        else:
+            for digit in "0123456789":
+                dfa.add_transition(state, digit, state + 1)
+    return dfa
+
+
+def sample_strings(count, seed=0):
+    rng = random.Random(seed)
+    strings = []
+    for _ in range(count):
+        code = f"{rng.randrange(100):02d}-{rng.randrange(1000):03d}"
+        if rng.random() < 0.3:
+            position = rng.randrange(len(code))
+            code = code[:position] + rng.choice("x-0 ") + code[position + 1:]
+        strings.append(code)
+    return strings
+
+
+def measure(function, inputs):
+    start = time.perf_counter()
+    for item in inputs:
+        function(item)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    strings = sample_strings(count)
+    encoded = [string.encode("ascii") for string in strings]
+
+    dict_dfa = postal_code_automaton()
+    compiled_dfa = postal_code_automaton().compile()
+
+    assert all(dict_dfa.accepts(s) == compiled_dfa.accepts(s) == compiled_dfa.accepts_bytes(b)
+               for s, b in zip(strings, encoded))
+    assert list(compiled_dfa.accepts_many(strings)) == [dict_dfa.accepts(s) for s in strings]
+
+    results = [
+        ("dict accepts", measure(dict_dfa.accepts, strings)),
+        ("compiled accepts", measure(compiled_dfa.accepts, strings)),
+        ("compiled accepts_bytes", measure(compiled_dfa.accepts_bytes, encoded)),
+        ("accepts_many", measure(compiled_dfa.accepts_many, [strings])),
+    ]
+    baseline = results[0][1]
+    for name, elapsed in results:
+        print(f"{name:24s} {count / elapsed:12.0f} napisow/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Porownanie czasu wczytywania automatow z pliku tekstowego: obecne loadery
+(strumieniowe) vs poprzednia wersja (readlines + lista przejsc + add_state w petli).
+
+Uruchomienie (z katalogu glownego repozytorium):
+    python benchmarks/bench_loader.py [liczba_przejsc]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from automata import DFA, NFA, import_DFA_from_file, import_NFA_from_file
+
+
+def legacy_import_DFA_from_file(file):
+    dfa = DFA()
+    with open(file, 'r') as f:
+        lines = f.readlines()
+    transitions = []
+    final_states = set()
+    for line in lines:
+        parts = line.strip().split()
+        if len(parts) == 3:
+            transitions.append((int(parts[0]), int(parts[1]), parts[2]))
+        elif len(parts) == 1:
+            final_states.add(int(parts[0]))
+    max_state = max(max(states[0], states[1]) for states in transitions) if transitions else 0
+    i = 0
+    while i <= max_state:
+        dfa.add_state()
+        i += 1
+    dfa.mark_as_initial(0)
+    for final_state in final_states:
+        dfa.mark_as_final(final_state)
+    for state_from, state_to, character in transitions:
+        dfa.add_transition(state_from, character, state_to)
+    return dfa
+
+
+def legacy_import_NFA_from_file(file):
+    nfa = NFA()
+    with open(file, 'r') as f:
+        lines = f.readlines()
+    transitions_data = []
+    final_states = set()
+    max_state = -1
+    for line in lines:
+        parts = line.strip().split()
+        if not parts:
+            continue
+        if len(parts) == 3:
+            state_from, state_to, character = int(parts[0]), int(parts[1]), parts[2]
+            transitions_data.append((state_from, state_to, character))
+            max_state = max(max_state, state_from, state_to)
+        elif len(parts) == 1:
+            state = int(parts[0])
+            final_states.add(state)
+            max_state = max(max_state, state)
+    for _ in range(max_state + 1):
+        nfa.add_state()
+    nfa.mark_as_initial(0)
+    for state in final_states:
+        nfa.mark_as_final(state)
+    for (state_from, state_to, character) in transitions_data:
+        if character == "<eps>":
+            nfa.add_epsilon_transition(state_from, state_to)
+        else:
+            nfa.add_transition(state_from, character, state_to)
+    return nfa
+
+
+def write_random_automaton(file, number_of_transitions, deterministic, seed=0):
+    rng = random.Random(seed)
+    alphabet = "abcdefghij0123456789"
+    number_of_states = max(number_of_transitions // len(alphabet), 1)
+    with open(file, 'w') as f:
+        if deterministic:
+            for state in range(number_of_states):
+                for character in alphabet:
+                    f.write(f"{state} {rng.randrange(number_of_states)} {character}\n")
+        else:
+            for _ in range(number_of_transitions):
+                character = "<eps>" if rng.random() < 0.05 else rng.choice(alphabet)
+                f.write(f"{rng.randrange(number_of_states)} {rng.randrange(number_of_states)} {character}\n")
+        for state in rng.sample(range(number_of_states), max(number_of_states // 10, 1)):
+            f.write(f"{state}\n")
+
+
+def measure(loader, file, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(file)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    number_of_transitions = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    with tempfile.TemporaryDirectory() as directory:
+        for kind, deterministic, legacy, current in (
+                ("DFA", True, legacy_import_DFA_from_file, import_DFA_from_file),
+                ("NFA", False, legacy_import_NFA_from_file, import_NFA_from_file)):
+            file = os.path.join(directory, f"{kind}.txt")
+            write_random_automaton(file, number_of_transitions, deterministic)
+            assert legacy(file).transitions == current(file).transitions
+            legacy_time = measure(legacy, file)
+            current_time = measure(current, file)
+            print(f"{kind}: poprzedni {legacy_time:.3f}s, obecny {current_time:.3f}s, x{legacy_time / current_time:.2f}")
+
+
+if __name__ == '__main__':
+    main()
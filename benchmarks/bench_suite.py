@@ -0,0 +1,209 @@
+"""
+Zestaw benchmarkow automatow i gramatyk z wynikami w JSON (do sledzenia regresji miedzy
+wersjami): wczytywanie plikow, accepts, usuwanie ε-przejsc, determinizacja oraz
+canGenerateByCFG, na syntetycznych automatach z workloads.py.
+
+Uruchomienie (z katalogu glownego repozytorium):
+    python benchmarks/bench_suite.py [--quick] [--repeat N] [--output wyniki.json]
+                                     [--baseline poprzednie.json] [--filter fragment_nazwy]
+
+Bez --output JSON wypisywany jest na standardowe wyjscie. Z --baseline na stderr trafia
+porownanie czasow (ratio > 1 to spowolnienie).
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+GRAMMARS = os.path.join(ROOT, "Grammars")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, GRAMMARS)
+
+from automata import (DFA, convert_nfa_to_dfa, export_DFA_to_file, import_DFA_from_file,
+                      import_NFA_from_file, remove_epsilon_transitions)
+from workloads import epsilon_chain_nfa, nth_from_end_nfa, random_nfa, random_strings, write_nfa
+
+
+def measure(function, repeat):
+    # czasy kolejnych powtorzen (sekundy); pierwsze powtorzenie zawiera rozgrzewke
+    # (np. kompilacje gramatyki w cache), wiec do porownan sluzy best_s albo median_s
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class Suite:
+    def __init__(self, repeat, name_filter=None):
+        self.repeat = repeat
+        self.name_filter = name_filter
+        self.results = []
+
+    def run(self, name, function, repeat=None, **params):
+        # params opisuja obciazenie (rozmiar, liczba napisow, ...) i trafiaja do JSON
+        if self.name_filter and self.name_filter not in name:
+            return
+        times = measure(function, repeat or self.repeat)
+        self.results.append({
+            "name": name,
+            "params": params,
+            "repeat": len(times),
+            "best_s": min(times),
+            "median_s": statistics.median(times),
+            "mean_s": statistics.fmean(times),
+        })
+        print(f"{name:45s} {min(times) * 1000:10.3f} ms", file=sys.stderr)
+
+
+def bench_loaders(suite, directory, sizes):
+    for number_of_states in sizes:
+        nfa = random_nfa(number_of_states, alphabet_size=10, density=1.0, epsilon_density=0.05, seed=1)
+        nfa_file = os.path.join(directory, f"nfa_{number_of_states}.txt")
+        write_nfa(nfa, nfa_file)
+        transitions = sum(len(targets) for targets in nfa.transitions.values())
+        suite.run(f"import_NFA_from_file/random/{number_of_states}",
+                  lambda: import_NFA_from_file(nfa_file), states=number_of_states, transitions=transitions)
+
+        dfa = _random_dfa(number_of_states, 10, seed=1)
+        dfa_file = os.path.join(directory, f"dfa_{number_of_states}.txt")
+        export_DFA_to_file(dfa, dfa_file)
+        suite.run(f"import_DFA_from_file/random/{number_of_states}",
+                  lambda: import_DFA_from_file(dfa_file), states=dfa.number_of_states,
+                  transitions=len(dfa.transitions))
+
+
+def _random_dfa(number_of_states, alphabet_size, seed):
+    # pelny losowy DFA (rzutowanie losowego NFA z gestoscia 1 bez ε na pierwszy cel)
+    nfa = random_nfa(number_of_states, alphabet_size, density=1.0, epsilon_density=0.0, seed=seed)
+    dfa = DFA()
+    dfa.number_of_states = nfa.number_of_states
+    dfa.mark_as_initial(0)
+    for state in nfa.final_states:
+        dfa.mark_as_final(state)
+    for (state_from, symbol), targets in nfa.transitions.items():
+        dfa.add_transition(state_from, symbol, min(targets))
+    return dfa
+
+
+def bench_accepts(suite, count):
+    strings = random_strings(count, "01", max_length=64, seed=2)
+    for n in (8, 16):
+        nfa = nth_from_end_nfa(n)
+        suite.run(f"NFA.accepts/nth_from_end/{n}",
+                  lambda: [nfa.accepts(string) for string in strings], n=n, strings=count)
+        dfa = nfa.to_dfa()
+        suite.run(f"DFA.accepts/nth_from_end/{n}",
+                  lambda: [dfa.accepts(string) for string in strings], n=n, strings=count,
+                  dfa_states=dfa.number_of_states)
+
+    nfa = random_nfa(64, alphabet_size=2, density=1.5, epsilon_density=0.2, seed=3)
+    suite.run("NFA.accepts/random/64", lambda: [nfa.accepts(string) for string in strings],
+              states=64, strings=count)
+    chain = epsilon_chain_nfa(256)
+    chain_strings = random_strings(count // 10, "ab", max_length=64, seed=4)
+    suite.run("NFA.accepts/epsilon_chain/256", lambda: [chain.accepts(string) for string in chain_strings],
+              states=256, strings=len(chain_strings))
+
+
+def bench_constructions(suite, directory, nth_sizes, random_sizes, determinize_sizes):
+    for number_of_states in random_sizes:
+        nfa_file = os.path.join(directory, f"eps_{number_of_states}.txt")
+        write_nfa(random_nfa(number_of_states, alphabet_size=4, density=1.0, epsilon_density=0.3, seed=5), nfa_file)
+        output = os.path.join(directory, "out.txt")
+        suite.run(f"remove_epsilon_transitions/random/{number_of_states}",
+                  lambda: remove_epsilon_transitions(nfa_file, output), states=number_of_states)
+
+    for n in nth_sizes:
+        nfa_file = os.path.join(directory, f"nth_{n}.txt")
+        write_nfa(nth_from_end_nfa(n), nfa_file)
+        output = os.path.join(directory, "out.txt")
+        suite.run(f"convert_nfa_to_dfa/nth_from_end/{n}",
+                  lambda: convert_nfa_to_dfa(nfa_file, output), n=n, dfa_states=2 ** n)
+
+    # losowe NFA o gestosci > 1 szybko eksploduja przy determinizacji - stad male rozmiary
+    for number_of_states in determinize_sizes:
+        nfa_file = os.path.join(directory, f"det_{number_of_states}.txt")
+        write_nfa(random_nfa(number_of_states, alphabet_size=2, density=1.5, epsilon_density=0.1, seed=6), nfa_file)
+        output = os.path.join(directory, "out.txt")
+        suite.run(f"convert_nfa_to_dfa/random/{number_of_states}",
+                  lambda: convert_nfa_to_dfa(nfa_file, output, max_states=200000), states=number_of_states)
+
+
+def bench_grammars(suite, sentence_repeat):
+    import ArithmeticsMethods
+    import PolishMethods
+    for name, module in (("arithmetics", ArithmeticsMethods), ("polish", PolishMethods)):
+        grammar = module.readGrammar(os.path.join(GRAMMARS, f"grammar_{name}.txt"))
+        sentences = module.readSentences(os.path.join(GRAMMARS, f"sentences_{name}.txt")) * sentence_repeat
+        engines = ["native"]
+        try:
+            import nltk  # noqa: F401
+            engines.append("nltk")
+        except ImportError:
+            pass
+        for engine in engines:
+            suite.run(f"canGenerateByCFG/{name}/{engine}",
+                      lambda: [module.canGenerateByCFG(grammar, sentence, engine) for sentence in sentences],
+                      engine=engine, sentences=len(sentences))
+
+
+def compare(results, baseline_file):
+    with open(baseline_file) as f:
+        baseline = {entry["name"]: entry for entry in json.load(f)["results"]}
+    for entry in results:
+        previous = baseline.get(entry["name"])
+        if previous is not None and previous["best_s"] > 0:
+            ratio = entry["best_s"] / previous["best_s"]
+            print(f"{entry['name']:45s} x{ratio:6.2f}{'  REGRESJA' if ratio > 1.2 else ''}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarki automatow i gramatyk (wynik w JSON)")
+    parser.add_argument("--quick", action="store_true", help="mniejsze obciazenia (szybki przebieg)")
+    parser.add_argument("--repeat", type=int, default=5, help="liczba powtorzen kazdego pomiaru")
+    parser.add_argument("--output", help="plik wynikowy JSON (domyslnie stdout)")
+    parser.add_argument("--baseline", help="poprzedni plik JSON do porownania")
+    parser.add_argument("--filter", help="tylko benchmarki, ktorych nazwa zawiera ten napis")
+    args = parser.parse_args(argv)
+
+    suite = Suite(args.repeat, args.filter)
+    with tempfile.TemporaryDirectory() as directory:
+        if args.quick:
+            bench_loaders(suite, directory, (1000,))
+            bench_accepts(suite, 1000)
+            bench_constructions(suite, directory, (8, 10), (50,), (18,))
+            bench_grammars(suite, 1)
+        else:
+            bench_loaders(suite, directory, (1000, 100000))
+            bench_accepts(suite, 10000)
+            bench_constructions(suite, directory, (8, 12, 16), (50, 500), (18, 22))
+            bench_grammars(suite, 10)
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "quick": args.quick,
+        "results": suite.results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.baseline:
+        compare(suite.results, args.baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Generatory syntetycznych automatow i napisow dla benchmarkow (bench_suite.py).
+
+Wszystkie generatory sa deterministyczne dla zadanego ziarna (seed).
+"""
+import random
+
+from automata import NFA
+
+
+def alphabet_of(size):
+    # pierwsze size symboli z a-z, A-Z, 0-9 (pojedyncze znaki, bez '<eps>')
+    symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    if not 1 <= size <= len(symbols):
+        raise ValueError(f"rozmiar alfabetu musi byc w zakresie 1..{len(symbols)}")
+    return symbols[:size]
+
+
+def random_nfa(number_of_states, alphabet_size=2, density=2.0, epsilon_density=0.1,
+               final_ratio=0.1, seed=0):
+    # losowy NFA: srednio density przejsc na pare (stan, symbol) i epsilon_density
+    # ε-przejsc na stan; stan 0 jest poczatkowy
+    rng = random.Random(seed)
+    alphabet = alphabet_of(alphabet_size)
+    nfa = NFA()
+    for _ in range(number_of_states):
+        nfa.add_state()
+    nfa.mark_as_initial(0)
+    for state in rng.sample(range(number_of_states), max(int(number_of_states * final_ratio), 1)):
+        nfa.mark_as_final(state)
+    for state in range(number_of_states):
+        for character in alphabet:
+            for _ in range(_count(rng, density)):
+                nfa.add_transition(state, character, rng.randrange(number_of_states))
+        for _ in range(_count(rng, epsilon_density)):
+            nfa.add_epsilon_transition(state, rng.randrange(number_of_states))
+    return nfa
+
+
+def _count(rng, mean):
+    # liczba calkowita o wartosci oczekiwanej mean (czesc ulamkowa losowana)
+    whole = int(mean)
+    return whole + (rng.random() < mean - whole)
+
+
+def nth_from_end_nfa(n, alphabet="01", symbol="1"):
+    # jezyk "n-ty symbol od konca to symbol": NFA ma n + 1 stanow, a minimalny DFA 2^n -
+    # najgorszy przypadek determinizacji
+    nfa = NFA()
+    for _ in range(n + 1):
+        nfa.add_state()
+    nfa.mark_as_initial(0)
+    nfa.mark_as_final(n)
+    for character in alphabet:
+        nfa.add_transition(0, character, 0)
+    nfa.add_transition(0, symbol, 1)
+    for state in range(1, n):
+        for character in alphabet:
+            nfa.add_transition(state, character, state + 1)
+    return nfa
+
+
+def epsilon_chain_nfa(n, alphabet="ab"):
+    # lancuch n ε-przejsc z petla po kazdym symbolu w kazdym stanie - duze ε-domkniecia
+    nfa = NFA()
+    for _ in range(n):
+        nfa.add_state()
+    nfa.mark_as_initial(0)
+    nfa.mark_as_final(n - 1)
+    for state in range(n):
+        if state + 1 < n:
+            nfa.add_epsilon_transition(state, state + 1)
+        nfa.add_transition(state, alphabet[state % len(alphabet)], state)
+    return nfa
+
+
+def random_strings(count, alphabet, min_length=0, max_length=32, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(min_length, max_length)))
+            for _ in range(count)]
+
+
+def write_nfa(nfa, file):
+    # zapis w formacie czytanym przez import_NFA_from_file ('<eps>' dla ε-przejsc)
+    with open(file, 'w') as f:
+        for (state_from, symbol), targets in nfa.transitions.items():
+            for state_to in sorted(targets):
+                f.write(f"{state_from} {state_to} {'<eps>' if symbol is None else symbol}\n")
+        for state in sorted(nfa.final_states):
+            f.write(f"{state}\n")
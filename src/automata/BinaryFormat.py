@@ -0,0 +1,195 @@
+"""
+Binarny format skompilowanego automatu.
+
+Uklad pliku (little-endian):
+- naglowek: magic b'FSAB', wersja, rodzaj ('D' albo 'N'), liczba stanow, liczba symboli,
+  stan poczatkowy (-1 gdy brak), szerokosc wiersza, dlugosc tablicy, dlugosc alfabetu,
+- alfabet: dla kazdego symbolu numer klasy (u32, kolumna tablicy), dlugosc (u16) i bajty
+  UTF-8, calosc dopelniona do 4 bajtow,
+- tablica int32:
+  - DFA: gesta tablica przejsc z DFA.compile() (kolumny to klasy symboli, przesuniecia
+    wierszy, -1 = stan martwy),
+  - NFA: CSR - (stany x (symbole + 1) + 1) poczatkow list, a po nich cele przejsc;
+    ostatnia kolumna to ε-przejscia,
+- flagi stanow koncowych: bajt na stan (1 = koncowy).
+
+DFA wczytywany jest przez mmap: tablica przejsc i flagi stanow koncowych sa uzywane
+w miejscu (memoryview na zmapowanym pliku), bez parsowania i kopiowania, wiec wiele
+procesow dzieli te same strony pamieci podrecznej; zbior final_states powstaje dopiero,
+gdy ktos o niego poprosi. NFA symulowany jest na maskach bitowych, wiec jego przejscia
+odtwarzane sa do slownika (bez parsowania tekstu).
+"""
+import mmap
+import struct
+import sys
+from array import array
+
+from .DFA import DFA
+from .NFA import NFA, import_NFA_from_file
+
+MAGIC = b'FSAB'
+VERSION = 1
+HEADER = struct.Struct('<4sBcxxIIiIII')
+SYMBOL_LENGTH = struct.Struct('<H')
+SYMBOL_CLASS = struct.Struct('<I')
+
+# tablice w pliku sa int32 little-endian - na innych platformach kopiujemy z konwersja
+_ZERO_COPY = sys.byteorder == 'little' and array('i').itemsize == 4
+
+
+def _int32_bytes(values):
+    table = array('i', values)
+    if sys.byteorder != 'little':
+        table.byteswap()
+    return table.tobytes()
+
+
+def _alphabet_bytes(symbols, classes):
+    parts = []
+    for symbol, symbol_class in zip(symbols, classes):
+        encoded = symbol.encode('utf-8')
+        parts.append(SYMBOL_CLASS.pack(symbol_class))
+        parts.append(SYMBOL_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    data = b''.join(parts)
+    return data + b'\0' * (-len(data) % 4)
+
+
+def _final_flags(final_states, number_of_states):
+    flags = bytearray(number_of_states)
+    for state in final_states:
+        if state < number_of_states:
+            flags[state] = 1
+    return flags
+
+
+def _write(file, kind, number_of_states, symbols, classes, initial_state, width, table, final_flags):
+    alphabet = _alphabet_bytes(symbols, classes)
+    with open(file, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, kind, number_of_states, len(symbols),
+                            -1 if initial_state is None else initial_state,
+                            width, len(table), len(alphabet)))
+        f.write(alphabet)
+        f.write(_int32_bytes(table))
+        f.write(final_flags)
+
+
+def export_DFA_to_binary(dfa, file):
+    if not dfa.is_compiled():
+        dfa.compile()
+    _write(file, b'D', len(dfa._final_flags), dfa._symbols, dfa._classes, dfa.initial_state, dfa._width,
+           dfa._table, dfa._final_flags)
+
+
+def export_NFA_to_binary(nfa, file):
+    number_of_states = nfa._size()
+    symbols = sorted({symbol for (_, symbol) in nfa.transitions if symbol is not None})
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+    width = len(symbols) + 1  # ostatnia kolumna to ε
+
+    lists = [()] * (number_of_states * width)
+    for (state_from, symbol), targets in nfa.transitions.items():
+        column = width - 1 if symbol is None else symbol_ids[symbol]
+        lists[state_from * width + column] = sorted(targets)
+
+    offsets = [0]
+    targets = []
+    for targets_of_cell in lists:
+        targets.extend(targets_of_cell)
+        offsets.append(len(targets))
+    _write(file, b'N', number_of_states, symbols, range(len(symbols)), nfa.initial_state, width,
+           offsets + targets, _final_flags(nfa.final_states, number_of_states))
+
+
+def _open(file, expected_kind):
+    with open(file, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        raise ValueError(f"{file}: plik za krotki na naglowek automatu")
+    (magic, version, kind, number_of_states, number_of_symbols, initial_state,
+     width, table_length, alphabet_length) = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError(f"{file}: to nie jest binarny plik automatu")
+    if version != VERSION:
+        raise ValueError(f"{file}: nieobslugiwana wersja formatu {version}")
+    if kind != expected_kind:
+        raise ValueError(f"{file}: plik zawiera {kind.decode()}FA, oczekiwano {expected_kind.decode()}FA")
+
+    position = HEADER.size
+    symbols = []
+    classes = []
+    for _ in range(number_of_symbols):
+        classes.append(SYMBOL_CLASS.unpack_from(view, position)[0])
+        position += SYMBOL_CLASS.size
+        (length,) = SYMBOL_LENGTH.unpack_from(view, position)
+        position += SYMBOL_LENGTH.size
+        symbols.append(bytes(view[position:position + length]).decode('utf-8'))
+        position += length
+    position = HEADER.size + alphabet_length
+
+    table_end = position + 4 * table_length
+    flags_end = table_end + number_of_states
+    if len(view) < flags_end:
+        raise ValueError(f"{file}: plik automatu jest uciety")
+    if _ZERO_COPY:
+        table = view[position:table_end].cast('i')
+    else:
+        table = array('i', bytes(view[position:table_end]))
+        if sys.byteorder != 'little':
+            table.byteswap()
+
+    final_flags = view[table_end:flags_end]
+    initial_state = None if initial_state < 0 else initial_state
+    return number_of_states, symbols, classes, initial_state, width, table, final_flags
+
+
+def import_DFA_from_binary(file):
+    number_of_states, symbols, classes, initial_state, width, table, final_flags = _open(file, b'D')
+    dfa = DFA()
+    dfa.number_of_states = number_of_states
+    dfa.initial_state = initial_state
+    # slownik przejsc i zbior stanow koncowych powstana dopiero, gdy ktos o nie poprosi
+    # (DFA.transitions, DFA.final_states) - do dopasowania wystarcza tablica i flagi
+    dfa._transitions = None
+    dfa._final_states = None
+    dfa._set_compiled(symbols, width, table, final_flags, classes)
+    return dfa
+
+
+def import_NFA_from_binary(file):
+    number_of_states, symbols, _, initial_state, width, table, final_flags = _open(file, b'N')
+    nfa = NFA()
+    nfa.number_of_states = number_of_states
+    nfa.initial_state = initial_state
+    nfa.final_states = {state for state, flag in enumerate(final_flags) if flag}
+    cells = number_of_states * width
+    columns = symbols + [None]
+    for cell in range(cells):
+        start, end = table[cell], table[cell + 1]
+        if start != end:
+            state_from, column = divmod(cell, width)
+            nfa.transitions[(state_from, columns[column])] = set(table[cells + 1 + start:cells + 1 + end])
+    return nfa
+
+
+def convert_text_to_binary(input_file, output_file):
+    # automat bez ε-przejsc i z co najwyzej jednym celem dla kazdej pary (stan, symbol)
+    # zapisywany jest jako DFA, pozostale jako NFA
+    nfa = import_NFA_from_file(input_file)
+    deterministic = all(symbol is not None and len(targets) == 1
+                        for (_, symbol), targets in nfa.transitions.items())
+    if not deterministic:
+        export_NFA_to_binary(nfa, output_file)
+        return 'NFA'
+
+    dfa = DFA()
+    dfa.number_of_states = nfa.number_of_states
+    dfa.mark_as_initial(nfa.initial_state)
+    for state in nfa.final_states:
+        dfa.mark_as_final(state)
+    for (state_from, symbol), targets in nfa.transitions.items():
+        dfa.add_transition(state_from, symbol, next(iter(targets)))
+    export_DFA_to_binary(dfa, output_file)
+    return 'DFA'
+
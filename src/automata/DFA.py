@@ -0,0 +1,712 @@
+from array import array
+from collections import deque
+
+# numpy jest opcjonalny (bez niego accepts_many liczy wynik petla) i ladowany dopiero
+# przy pierwszym accepts_many, zeby nie wydluzac importu modulu
+numpy = None
+_numpy_checked = False
+
+DEAD_STATE = -1  # wartownik w skompilowanej tablicy przejsc
+
+
+def _load_numpy():
+    global numpy, _numpy_checked
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+    return numpy
+
+
+class DFA:
+    def __init__(self):
+        self.number_of_states = 0
+        self.initial_state = None
+        self._final_states = set()
+        self._transitions = {}
+        self._table = None  # skompilowana tablica przejsc, patrz compile()
+
+    @property
+    def transitions(self):
+        # automat wczytany z pliku binarnego ma tylko tablice - slownik odtwarzany na zadanie
+        if self._transitions is None:
+            self._transitions = self._transitions_from_table()
+        return self._transitions
+
+    @transitions.setter
+    def transitions(self, transitions):
+        self._invalidate()
+        self._transitions = transitions
+
+    @property
+    def final_states(self):
+        # tak samo zbior stanow koncowych - plik binarny daje tylko _final_flags
+        if self._final_states is None:
+            self._final_states = self._final_states_from_flags()
+        return self._final_states
+
+    @final_states.setter
+    def final_states(self, states):
+        # nowy zbior uniewaznia skompilowana tablice (flagi stanow koncowych)
+        self._invalidate()
+        self._final_states = states
+
+    def _invalidate(self):
+        if self._transitions is None:
+            self._transitions = self._transitions_from_table()
+        if self._final_states is None:
+            self._final_states = self._final_states_from_flags()
+        self._table = None
+
+    def add_state(self):
+        state = self.number_of_states
+        self.number_of_states += 1
+        self._invalidate()
+        return state
+
+    def mark_as_initial(self, state):
+        self.initial_state = state
+        self._invalidate()
+
+    def mark_as_final(self, state):
+        self.final_states.add(state)
+        self._invalidate()
+
+    def add_transition(self, state_from, character, state_to):
+        self._invalidate()
+        self._transitions[(state_from, character)] = state_to
+
+    def get_initial_state(self):
+        return self.initial_state
+
+    def get_target_state(self, state_from, character):
+        return self.transitions.get((state_from, character))
+
+    def is_final_state(self, state):
+        if self._final_states is None:
+            return 0 <= state < len(self._final_flags) and self._final_flags[state] == 1
+        return state in self._final_states
+
+    def get_number_of_states(self):
+        return self.number_of_states
+
+    def compile(self):
+        # symbole alfabetu dzielone sa na klasy rownowaznosci (symbole o identycznych
+        # przejsciach we wszystkich stanach, np. cyfry 0-9), klasy dostaja geste numery
+        # 0..k-1, a przejscia trafiaja do plaskiej tablicy array('i') o rozmiarze
+        # stany x klasy; brak przejscia to DEAD_STATE
+        symbols = sorted({character for (_, character) in self.transitions})
+        classes, number_of_classes = symbol_classes(symbols, self.transitions.items())
+        symbol_ids = {character: classes[i] for i, character in enumerate(symbols)}
+        width = max(number_of_classes, 1)
+
+        number_of_states = self.number_of_states
+        for (state_from, _), state_to in self.transitions.items():
+            number_of_states = max(number_of_states, state_from + 1, state_to + 1)
+        if self.initial_state is not None:
+            number_of_states = max(number_of_states, self.initial_state + 1)
+
+        # w tablicy trzymam od razu przesuniecie wiersza (stan * width), zeby w petli
+        # accepts nie bylo mnozenia
+        table = array('i', [DEAD_STATE]) * (number_of_states * width)
+        for (state_from, character), state_to in self.transitions.items():
+            table[state_from * width + symbol_ids[character]] = state_to * width
+
+        final_flags = bytearray(number_of_states)
+        for state in self.final_states:
+            if state < number_of_states:
+                final_flags[state] = 1
+
+        self._set_compiled(symbols, width, table, final_flags, classes)
+        return self
+
+    def _set_compiled(self, symbols, width, table, final_flags, classes=None):
+        # table to dowolny bufor int-ow z przesunieciami wierszy (array('i') albo
+        # memoryview na mmap pliku binarnego), final_flags - bajt na stan (bytearray albo
+        # memoryview); classes[i] to kolumna (klasa) symbolu
+        # symbols[i], bez classes kazdy symbol ma wlasna kolumne
+        if classes is None:
+            classes = range(len(symbols))
+        symbol_ids = {character: classes[i] for i, character in enumerate(symbols)}
+
+        # mapa bajt -> numer klasy dla accepts_bytes (tylko symbole jednoznakowe < 256)
+        byte_ids = array('i', [DEAD_STATE]) * 256
+        for character, symbol in symbol_ids.items():
+            if len(character) == 1 and ord(character) < 256:
+                byte_ids[ord(character)] = symbol
+
+        self._symbols = symbols
+        self._classes = array('i', classes)
+        self._number_of_classes = max(classes, default=-1) + 1
+        self._symbol_ids = symbol_ids
+        self._byte_ids = byte_ids
+        self._width = width
+        self._final_flags = final_flags
+        self._table = table
+        self._batch_table = None
+
+    def _transitions_from_table(self):
+        transitions = {}
+        table = self._table
+        width = self._width
+        for state in range(len(self._final_flags)):
+            row = state * width
+            for character, symbol in self._symbol_ids.items():
+                offset = table[row + symbol]
+                if offset >= 0:
+                    transitions[(state, character)] = offset // width
+        return transitions
+
+    def _final_states_from_flags(self):
+        flags = self._final_flags
+        return {state for state in range(len(flags)) if flags[state]}
+
+    def is_compiled(self):
+        return self._table is not None
+
+    def _accepts_compiled(self, string):
+        if self.initial_state is None:
+            return False
+        table = self._table
+        symbol_ids = self._symbol_ids
+        width = self._width
+        offset = self.initial_state * width
+        for character in string:
+            symbol = symbol_ids.get(character)
+            if symbol is None:
+                return False
+            offset = table[offset + symbol]
+            if offset < 0:
+                return False
+        return self._final_flags[offset // width] == 1
+
+    def accepts_bytes(self, data):
+        # wersja accepts dla bytes/bytearray/memoryview, bez dekodowania do str
+        if self._table is None:
+            self.compile()
+        if self.initial_state is None:
+            return False
+        table = self._table
+        byte_ids = self._byte_ids
+        width = self._width
+        offset = self.initial_state * width
+        for byte in data:
+            symbol = byte_ids[byte]
+            if symbol < 0:
+                return False
+            offset = table[offset + symbol]
+            if offset < 0:
+                return False
+        return self._final_flags[offset // width] == 1
+
+    def _build_batch_table(self):
+        # gesta tablica numpy (stany + 1) x (klasy + 2) dla accepts_many:
+        # wiersz n to stan martwy, kolumna k to nieznany znak, kolumna k + 1 to dopelnienie,
+        # ktore zostawia stan bez zmian (wiersze krotsze niz najdluzszy napis)
+        width = self._width
+        number_of_states = len(self._final_flags)
+        number_of_classes = self._number_of_classes
+        dead = number_of_states
+
+        offsets = numpy.array(self._table, dtype=numpy.int64).reshape(number_of_states, width)
+        targets = numpy.where(offsets < 0, dead, offsets // width)[:, :number_of_classes]
+
+        dtype = numpy.uint8 if number_of_states + 1 <= 256 else numpy.uint32
+        table = numpy.empty((number_of_states + 1, number_of_classes + 2), dtype=dtype)
+        table[:number_of_states, :number_of_classes] = targets
+        table[:, number_of_classes] = dead
+        table[:, number_of_classes + 1] = numpy.arange(number_of_states + 1)
+        table[dead, :] = dead
+
+        finals = numpy.zeros(number_of_states + 1, dtype=bool)
+        finals[:number_of_states] = numpy.frombuffer(self._final_flags, dtype=numpy.uint8) == 1
+
+        # znak (bajt latin-1) -> kolumna tablicy
+        byte_columns = numpy.array(self._byte_ids, dtype=numpy.int64)
+        byte_columns[byte_columns < 0] = number_of_classes
+
+        self._batch_table = (table, finals, byte_columns)
+
+    def _pack_strings(self, strings, lengths, symbol_dtype):
+        # upakowanie napisow w macierz (wiersze x pozycje) numerow symboli, dopelniona
+        # kolumna "padding"; macierz w porzadku Fortran, bo czytana jest kolumnami
+        number_of_classes = self._number_of_classes
+        padding = number_of_classes + 1
+        byte_columns = self._batch_table[2]
+        matrix = numpy.full((len(strings), int(lengths.max(initial=0))), padding,
+                            dtype=symbol_dtype, order='F')
+        try:
+            data = "".join(strings).encode('latin-1')
+        except UnicodeEncodeError:
+            data = None
+
+        if data is not None:
+            columns = byte_columns[numpy.frombuffer(data, dtype=numpy.uint8)]
+            rows = numpy.repeat(numpy.arange(len(strings)), lengths)
+            starts = numpy.cumsum(lengths) - lengths
+            positions = numpy.arange(len(data)) - numpy.repeat(starts, lengths)
+            matrix[rows, positions] = columns
+        else:
+            symbol_ids = self._symbol_ids
+            unknown = number_of_classes
+            for row, string in enumerate(strings):
+                matrix[row, :len(string)] = [symbol_ids.get(character, unknown) for character in string]
+        return matrix
+
+    def accepts_many(self, strings):
+        # akceptacja calej kolumny napisow naraz: stany wszystkich wierszy przesuwane sa
+        # jednym odczytem z tablicy na kazda pozycje znaku; zwraca tablice bool
+        # (bez numpy - liste bool liczona zwyklym accepts)
+        if self._table is None:
+            self.compile()
+        strings = list(strings)
+        if _load_numpy() is None:
+            return [self._accepts_compiled(string) for string in strings]
+        if self.initial_state is None or not strings:
+            return numpy.zeros(len(strings), dtype=bool)
+        if self._batch_table is None:
+            self._build_batch_table()
+
+        table, finals, _ = self._batch_table
+        symbol_dtype = numpy.uint8 if self._number_of_classes + 2 <= 256 else numpy.uint32
+        lengths = numpy.fromiter((len(string) for string in strings), dtype=numpy.int64, count=len(strings))
+        matrix = self._pack_strings(strings, lengths, symbol_dtype)
+
+        states = numpy.full(len(strings), self.initial_state, dtype=table.dtype)
+        for position in range(matrix.shape[1]):
+            states = table[states, matrix[:, position]]
+        return finals[states]
+
+    def accepts(self, string):
+        if self._table is not None:
+            return self._accepts_compiled(string)
+        current_state = self.initial_state
+        for character in string:
+            current_state = self.get_target_state(current_state, character)
+            if current_state is None:
+                return False
+        return self.is_final_state(current_state)
+
+    def _outgoing(self):
+        # przejscia pogrupowane po stanie zrodlowym: stan -> [(symbol, cel), ...]
+        outgoing = {}
+        for (state_from, character), state_to in self.transitions.items():
+            outgoing.setdefault(state_from, []).append((character, state_to))
+        return outgoing
+
+    def minimize(self):
+        # minimalizacja Hopcrofta (podzial na klasy rownowaznosci), O(n·k·log n);
+        # zwraca nowy DFA z przenumerowanymi stanami, stan poczatkowy to 0
+        minimal = DFA()
+        if self.initial_state is None:
+            return minimal
+        outgoing = self._outgoing()
+
+        # tylko stany osiagalne ze stanu poczatkowego
+        reachable = {self.initial_state: 0}
+        order = [self.initial_state]
+        for state in order:
+            for _, state_to in outgoing.get(state, ()):
+                if state_to not in reachable:
+                    reachable[state_to] = len(order)
+                    order.append(state_to)
+
+        alphabet = sorted({character for state in order for character, _ in outgoing.get(state, ())})
+        dead = len(order)  # dodatkowy stan martwy uzupelniajacy brakujace przejscia
+        size = dead + 1
+
+        # przejscia odwrotne: symbol -> cel -> lista zrodel
+        inverse = {character: [[] for _ in range(size)] for character in alphabet}
+        for state in order:
+            index = reachable[state]
+            defined = set()
+            for character, state_to in outgoing.get(state, ()):
+                inverse[character][reachable[state_to]].append(index)
+                defined.add(character)
+            for character in alphabet:
+                if character not in defined:
+                    inverse[character][dead].append(index)
+        for character in alphabet:
+            inverse[character][dead].append(dead)
+
+        finals = [reachable[state] for state in order if state in self.final_states]
+        final_set = set(finals)
+        non_finals = [index for index in range(size) if index not in final_set]
+        blocks = [set(block) for block in (finals, non_finals) if block]
+        block_of = [0] * size
+        for block_id, block in enumerate(blocks):
+            for index in block:
+                block_of[index] = block_id
+
+        smaller = min(range(len(blocks)), key=lambda block_id: len(blocks[block_id]))
+        waiting = deque((smaller, character) for character in alphabet)
+        in_waiting = set(waiting)
+
+        while waiting:
+            splitter = waiting.popleft()
+            in_waiting.discard(splitter)
+            block_id, character = splitter
+            predecessors = inverse[character]
+
+            touched = {}
+            for index in blocks[block_id]:
+                for source in predecessors[index]:
+                    touched.setdefault(block_of[source], set()).add(source)
+
+            for touched_id, part in touched.items():
+                block = blocks[touched_id]
+                if len(part) == len(block):
+                    continue
+                # do nowego bloku trafia mniejsza czesc
+                rest = block - part
+                moved, kept = (part, rest) if len(part) <= len(rest) else (rest, part)
+                blocks[touched_id] = kept
+                new_id = len(blocks)
+                blocks.append(moved)
+                for index in moved:
+                    block_of[index] = new_id
+                for symbol in alphabet:
+                    if (new_id, symbol) not in in_waiting:
+                        in_waiting.add((new_id, symbol))
+                        waiting.append((new_id, symbol))
+
+        # nowy automat: bloki numerowane w kolejnosci BFS, blok stanu martwego pomijany
+        dead_block = block_of[dead]
+        targets = {}
+        for state in order:
+            index = reachable[state]
+            for character, state_to in outgoing.get(state, ()):
+                targets[(block_of[index], character)] = block_of[reachable[state_to]]
+        final_blocks = {block_of[index] for index in finals}
+
+        numbering = {block_of[0]: minimal.add_state()}
+        minimal.mark_as_initial(0)
+        queue = deque([block_of[0]])
+        while queue:
+            block_id = queue.popleft()
+            if block_id in final_blocks:
+                minimal.mark_as_final(numbering[block_id])
+            for character in alphabet:
+                target = targets.get((block_id, character), dead_block)
+                if target == dead_block:
+                    continue
+                if target not in numbering:
+                    numbering[target] = minimal.add_state()
+                    queue.append(target)
+                minimal.add_transition(numbering[block_id], character, numbering[target])
+        return minimal
+
+    def trim(self):
+        # usuniecie stanow nieosiagalnych i stanow, z ktorych nie da sie dojsc do stanu
+        # koncowego; zwraca nowy DFA, stan poczatkowy to 0
+        trimmed = DFA()
+        if self.initial_state is None:
+            return trimmed
+        order = useful_states(self.initial_state, self.final_states,
+                              ((state_from, state_to) for (state_from, _), state_to in self.transitions.items()))
+        numbering = {state: trimmed.add_state() for state in order}
+        trimmed.mark_as_initial(0)
+        for (state_from, character), state_to in self.transitions.items():
+            if state_from in numbering and state_to in numbering:
+                trimmed.add_transition(numbering[state_from], character, numbering[state_to])
+        for state in self.final_states:
+            if state in numbering:
+                trimmed.mark_as_final(numbering[state])
+        return trimmed
+
+    def _alphabet(self):
+        return {character for (_, character) in self.transitions}
+
+    def _product(self, other, accept, trim):
+        # konstrukcja produktowa tylko na osiagalnych parach stanow (BFS); brak przejscia to
+        # stan martwy None, para (None, None) jest pomijana; trim=True usuwa pary, z ktorych
+        # nie da sie dojsc do stanu koncowego
+        product = DFA()
+        alphabet = sorted(self._alphabet() | other._alphabet())
+        start = (self.initial_state, other.initial_state)
+        numbering = {start: product.add_state()}
+        product.mark_as_initial(0)
+        queue = deque([start])
+        while queue:
+            pair = queue.popleft()
+            first, second = pair
+            if accept(first is not None and first in self.final_states,
+                      second is not None and second in other.final_states):
+                product.mark_as_final(numbering[pair])
+            for character in alphabet:
+                target = (None if first is None else self.transitions.get((first, character)),
+                          None if second is None else other.transitions.get((second, character)))
+                if target == (None, None):
+                    continue
+                if target not in numbering:
+                    numbering[target] = product.add_state()
+                    queue.append(target)
+                product.add_transition(numbering[pair], character, numbering[target])
+        return product.trim() if trim else product
+
+    def intersection(self, other, trim=False):
+        return self._product(other, lambda first, second: first and second, trim)
+
+    def union(self, other, trim=False):
+        return self._product(other, lambda first, second: first or second, trim)
+
+    def difference(self, other, trim=False):
+        return self._product(other, lambda first, second: first and not second, trim)
+
+    def complement(self, alphabet):
+        # dopelnienie wzgledem jawnego alfabetu: automat uzupelniony stanem pochlaniajacym
+        alphabet = sorted(set(alphabet))
+        unknown = self._alphabet() - set(alphabet)
+        if unknown:
+            raise ValueError(f"symbole spoza alfabetu: {sorted(unknown)}")
+        complement = DFA()
+        complement.mark_as_initial(complement.add_state())
+        numbering = {self.initial_state: 0}
+        queue = deque([self.initial_state])
+        while queue:
+            state = queue.popleft()
+            if state is None or state not in self.final_states:
+                complement.mark_as_final(numbering[state])
+            for character in alphabet:
+                target = None if state is None else self.transitions.get((state, character))
+                if target not in numbering:
+                    numbering[target] = complement.add_state()
+                    queue.append(target)
+                complement.add_transition(numbering[state], character, numbering[target])
+        return complement
+
+    def is_empty(self):
+        # czy jezyk jest pusty: BFS po stanach osiagalnych w poszukiwaniu stanu koncowego
+        if self.initial_state is None:
+            return True
+        outgoing = self._outgoing()
+        seen = {self.initial_state}
+        queue = deque([self.initial_state])
+        while queue:
+            state = queue.popleft()
+            if state in self.final_states:
+                return False
+            for _, state_to in outgoing.get(state, ()):
+                if state_to not in seen:
+                    seen.add(state_to)
+                    queue.append(state_to)
+        return True
+
+    def _equivalent_hopcroft_karp(self, other, alphabet):
+        # Hopcroft-Karp: union-find na stanach obu automatow, para laczona przy pierwszym
+        # spotkaniu; stan martwy (None) jest wspolny dla obu automatow
+        parent = {}
+
+        def find(key):
+            root = key
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while key != root:
+                parent[key], key = root, parent.get(key, key)
+            return root
+
+        def key_of(index, state):
+            return None if state is None else (index, state)
+
+        def is_final(automaton, state):
+            return state is not None and state in automaton.final_states
+
+        first, second = self.initial_state, other.initial_state
+        parent[key_of(0, first)] = key_of(1, second)
+        stack = [(first, second)]
+        while stack:
+            first, second = stack.pop()
+            if is_final(self, first) != is_final(other, second):
+                return False
+            for character in alphabet:
+                next_first = None if first is None else self.transitions.get((first, character))
+                next_second = None if second is None else other.transitions.get((second, character))
+                root_first, root_second = find(key_of(0, next_first)), find(key_of(1, next_second))
+                if root_first != root_second:
+                    parent[root_first] = root_second
+                    stack.append((next_first, next_second))
+        return True
+
+    def find_counterexample(self, other):
+        # najkrotszy napis akceptowany przez dokladnie jeden z automatow albo None, gdy sa
+        # rownowazne; rownowaznosc rozstrzyga Hopcroft-Karp, a dopiero gdy jej nie ma,
+        # BFS po parach stanow odtwarza najkrotszy kontrprzyklad
+        alphabet = sorted(self._alphabet() | other._alphabet())
+        if self._equivalent_hopcroft_karp(other, alphabet):
+            return None
+        start = (self.initial_state, other.initial_state)
+        previous = {start: None}
+        queue = deque([start])
+        while queue:
+            pair = queue.popleft()
+            first, second = pair
+            if (first is not None and first in self.final_states) != \
+                    (second is not None and second in other.final_states):
+                characters = []
+                while previous[pair] is not None:
+                    pair, character = previous[pair]
+                    characters.append(character)
+                return "".join(reversed(characters))
+            for character in alphabet:
+                target = (None if first is None else self.transitions.get((first, character)),
+                          None if second is None else other.transitions.get((second, character)))
+                if target != (None, None) and target not in previous:
+                    previous[target] = (pair, character)
+                    queue.append(target)
+        return None
+
+    def is_equivalent(self, other):
+        return self.find_counterexample(other) is None
+
+    def matcher(self):
+        # dopasowanie przyrostowe (porcjami), patrz DFAMatcher
+        return DFAMatcher(self)
+
+
+class DFAMatcher:
+    # wznawialne dopasowanie: miedzy kolejnymi feed() pamietany jest tylko biezacy stan,
+    # wiec strumien dowolnej dlugosci zajmuje stala pamiec; uzywa tablicy z compile()
+    # w chwili utworzenia (pozniejsze zmiany automatu nie sa widoczne)
+    def __init__(self, dfa):
+        if dfa._table is None:
+            dfa.compile()
+        self._initial = DEAD_STATE if dfa.initial_state is None else dfa.initial_state * dfa._width
+        self._table = dfa._table
+        self._symbol_ids = dfa._symbol_ids
+        self._byte_ids = dfa._byte_ids
+        self._width = dfa._width
+        self._final_flags = dfa._final_flags
+        self._offset = self._initial
+
+    def reset(self):
+        self._offset = self._initial
+        return self
+
+    def feed(self, chunk):
+        # chunk to str albo bytes/bytearray/memoryview (bajty jako znaki latin-1)
+        offset = self._offset
+        if offset < 0:
+            return self
+        table = self._table
+        if isinstance(chunk, str):
+            symbol_ids = self._symbol_ids
+            for character in chunk:
+                symbol = symbol_ids.get(character)
+                if symbol is None:
+                    offset = DEAD_STATE
+                    break
+                offset = table[offset + symbol]
+                if offset < 0:
+                    break
+        else:
+            byte_ids = self._byte_ids
+            for byte in chunk:
+                symbol = byte_ids[byte]
+                if symbol < 0:
+                    offset = DEAD_STATE
+                    break
+                offset = table[offset + symbol]
+                if offset < 0:
+                    break
+        self._offset = offset
+        return self
+
+    def is_dead(self):
+        return self._offset < 0
+
+    def is_accepting(self):
+        return self._offset >= 0 and self._final_flags[self._offset // self._width] == 1
+
+
+def symbol_classes(symbols, transitions):
+    # podzial alfabetu na klasy symboli o identycznych przejsciach w kazdym stanie;
+    # transitions to pary ((stan, symbol), cel), cel moze byc dowolnym obiektem
+    # haszowalnym (np. zbiorem stanow NFA jako frozenset albo maska); zwraca
+    # (numer klasy dla kolejnych symboli, liczba klas) - klasy numerowane wg pierwszego symbolu
+    columns = {symbol: [] for symbol in symbols}
+    for (state, symbol), target in transitions:
+        columns[symbol].append((state, target))
+    class_ids = {}
+    classes = []
+    for symbol in symbols:
+        signature = frozenset(columns[symbol])
+        classes.append(class_ids.setdefault(signature, len(class_ids)))
+    return classes, len(class_ids)
+
+
+def useful_states(initial_state, final_states, edges):
+    # stany osiagalne ze stanu poczatkowego (BFS w przod), z ktorych osiagalny jest stan
+    # koncowy (BFS po odwroconych krawedziach); edges to pary (stan, cel); wynik to lista:
+    # stan poczatkowy (zawsze, nawet gdy jezyk jest pusty), a po nim pozostale rosnaco
+    forward = {}
+    backward = {}
+    for state_from, state_to in edges:
+        forward.setdefault(state_from, []).append(state_to)
+        backward.setdefault(state_to, []).append(state_from)
+
+    def reachable(starts, graph):
+        seen = set(starts)
+        queue = deque(seen)
+        while queue:
+            for target in graph.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    useful = reachable([initial_state], forward) & reachable(final_states, backward)
+    useful.discard(initial_state)
+    return [initial_state] + sorted(useful)
+
+
+def import_DFA_from_file(file, trim=False):
+    # plik czytany strumieniowo linia po linii, przejscia trafiaja od razu do slownika,
+    # a liczba stanow ustawiana jest raz na koncu; trim=True usuwa zbedne stany (DFA.trim)
+    dfa = DFA()
+    transitions = dfa.transitions
+    final_states = dfa.final_states
+    max_state = 0
+
+    with open(file, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            parts = line.split()
+            try:
+                # jesli linia sklada sie z 3 elementow to tworze przejscie
+                if len(parts) == 3:
+                    state_from, state_to = int(parts[0]), int(parts[1])
+                    transitions[(state_from, parts[2])] = state_to
+                    if state_from > max_state:
+                        max_state = state_from
+                    if state_to > max_state:
+                        max_state = state_to
+                # jesli z jednego to dodaje stany koncowe
+                elif len(parts) == 1:
+                    state = int(parts[0])
+                    final_states.add(state)
+                    if state > max_state:
+                        max_state = state
+                elif parts:
+                    raise ValueError(f"oczekiwano 'stan stan symbol' albo 'stan', jest {len(parts)} pol")
+            except ValueError as error:
+                raise ValueError(f"{file}:{line_number}: niepoprawna linia {line.rstrip()!r}: {error}") from None
+
+    dfa.number_of_states = max_state + 1
+    dfa.mark_as_initial(0)
+    return dfa.trim() if trim else dfa
+
+
+def export_DFA_to_file(dfa, file):
+    # zapis w tym samym formacie, ktory czyta import_DFA_from_file
+    with open(file, 'w') as f:
+        for (state_from, character), state_to in dfa.transitions.items():
+            f.write(f"{state_from} {state_to} {character}\n")
+        for state in sorted(dfa.final_states):
+            f.write(f"{state}\n")
+
+
+def code_automaton(file="dfa_kody_pocztowe.txt"):
+    dfa = import_DFA_from_file(file)
+    return dfa
+
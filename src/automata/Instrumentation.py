@@ -0,0 +1,83 @@
+import time
+
+
+def _popcount(mask):
+    return bin(mask).count("1")
+
+
+class ConstructionStats:
+    # liczniki konstrukcji podzbiorow, wypelniane przez NFA.to_dfa(stats=...) i funkcje
+    # convert_*; liczniki sa aktualne takze po StateLimitError, wiec widac, gdzie nastapil
+    # wybuch; callback(stats) wolany jest co `every` utworzonych stanow DFA
+    def __init__(self, callback=None, every=1024):
+        self.callback = callback
+        self.every = every
+        self.states_created = 0
+        self.transitions_created = 0
+        self.max_subset_size = 0
+        self.alphabet_iterations = 0  # rozwazone pary (podzbior, klasa symboli)
+        self.epsilon_closure_seconds = 0.0
+        self.total_seconds = 0.0
+
+    def _state_created(self, subset):
+        self.states_created += 1
+        size = _popcount(subset)
+        if size > self.max_subset_size:
+            self.max_subset_size = size
+        if self.callback is not None and self.states_created % self.every == 0:
+            self.callback(self)
+
+    def as_dict(self):
+        return {
+            "states_created": self.states_created,
+            "transitions_created": self.transitions_created,
+            "max_subset_size": self.max_subset_size,
+            "alphabet_iterations": self.alphabet_iterations,
+            "epsilon_closure_seconds": self.epsilon_closure_seconds,
+            "total_seconds": self.total_seconds,
+        }
+
+
+class SimulationStats:
+    # liczba aktywnych stanow NFA po kolejnych pozycjach wejscia, wypelniana przez
+    # NFA.accepts(stats=...); active_states[0] to ε-domkniecie stanu poczatkowego, a
+    # active_states[i] stan po i znakach; callback(pozycja, liczba_aktywnych) dla kazdej
+    # pozycji (wtedy mozna nie zapisywac listy: keep_history=False)
+    def __init__(self, callback=None, keep_history=True):
+        self.callback = callback
+        self.keep_history = keep_history
+        self.active_states = []
+        self.max_active_states = 0
+        self.positions = 0
+
+    def _record(self, position, mask):
+        count = _popcount(mask)
+        self.positions = position
+        if count > self.max_active_states:
+            self.max_active_states = count
+        if self.keep_history:
+            self.active_states.append(count)
+        if self.callback is not None:
+            self.callback(position, count)
+
+    def as_dict(self):
+        return {
+            "positions": self.positions,
+            "max_active_states": self.max_active_states,
+            "active_states": list(self.active_states),
+        }
+
+
+class Timer:
+    # dodaje czas bloku with do atrybutu obiektu stats
+    def __init__(self, stats, attribute):
+        self.stats = stats
+        self.attribute = attribute
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        setattr(self.stats, self.attribute, getattr(self.stats, self.attribute) + time.perf_counter() - self.start)
+        return False
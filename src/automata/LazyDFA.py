@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+
+class LazyDFA:
+    # determinizacja "w locie" (w stylu RE2): stan DFA to ε-domknieta maska bitowa stanow NFA,
+    # tworzony dopiero gdy para (podzbior, symbol) pojawi sie w czasie dopasowania;
+    # pamiec podrecznych stanow jest ograniczona do max_states i zwalniana wg LRU
+    def __init__(self, nfa, max_states=1024):
+        if max_states < 1:
+            raise ValueError("max_states musi byc dodatnie")
+        self.nfa = nfa
+        self.max_states = max_states
+        self._cache = OrderedDict()  # maska podzbioru -> {klasa symbolu: maska nastepnika}
+        self._tables = None  # tablice masek NFA, dla ktorych wazny jest cache
+        self._class_of = {}  # symbol -> numer klasy symboli z compile_bitsets()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+    def clear(self):
+        self._cache.clear()
+
+    def _step(self, subset, character):
+        # jeden krok symulacji NFA na maskach bitowych
+        step = self._tables[1].get(character)
+        if step is None:
+            return 0
+        next_subset = 0
+        while subset:
+            lowest = subset & -subset
+            next_subset |= step[lowest.bit_length() - 1]
+            subset ^= lowest
+        return next_subset
+
+    def _row(self, subset):
+        cache = self._cache
+        row = cache.get(subset)
+        if row is not None:
+            cache.move_to_end(subset)
+            return row
+        if len(cache) >= self.max_states:
+            cache.popitem(last=False)
+            self.evictions += 1
+        row = cache[subset] = {}
+        return row
+
+    def accepts(self, string):
+        if self.nfa._bitsets is None:
+            self.nfa.compile_bitsets()
+        if self._tables is not self.nfa._bitsets:
+            # NFA zmienil sie od ostatniego dopasowania - zapamietane stany sa niewazne
+            self._cache.clear()
+            self._tables = self.nfa._bitsets
+            self._class_of = {symbol: class_id for class_id, members in enumerate(self._tables[4])
+                              for symbol in members}
+        current, _, final_mask, _, _ = self._tables
+        class_of = self._class_of
+        if self.nfa.initial_state is None:
+            return False
+
+        # gdy cache ciagle sie przepelnia (wiecej wyrzucen niz miesci sie stanow),
+        # dalsza czesc napisu liczona jest zwykla symulacja bez zapamietywania
+        eviction_limit = self.evictions + self.max_states
+        characters = iter(string)
+        for character in characters:
+            # wiersze cache indeksowane sa klasami symboli - jeden wpis na cala klase
+            class_id = class_of.get(character)
+            if class_id is None:
+                return False
+            row = self._row(current)
+            next_subset = row.get(class_id)
+            if next_subset is None:
+                self.misses += 1
+                next_subset = row[class_id] = self._step(current, character)
+            else:
+                self.hits += 1
+            current = next_subset
+            if not current:
+                return False
+            if self.evictions > eviction_limit:
+                self.fallbacks += 1
+                for character in characters:
+                    current = self._step(current, character)
+                    if not current:
+                        return False
+                break
+        return bool(current & final_mask)
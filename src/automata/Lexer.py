@@ -0,0 +1,87 @@
+from array import array
+
+from .NFA import NFA, union_of
+
+
+class LexerError(ValueError):
+    def __init__(self, position, character):
+        super().__init__(f"nierozpoznany znak {character!r} na pozycji {position}")
+        self.position = position
+        self.character = character
+
+
+def one_of(characters):
+    # automat jednego znaku ze zbioru characters
+    nfa = NFA()
+    start, end = nfa.add_state(), nfa.add_state()
+    nfa.mark_as_initial(start)
+    nfa.mark_as_final(end)
+    for character in characters:
+        nfa.add_transition(start, character, end)
+    return nfa
+
+
+def one_or_more(characters):
+    # automat niepustego ciagu znakow ze zbioru characters
+    nfa = one_of(characters)
+    for character in characters:
+        nfa.add_transition(1, character, 1)
+    return nfa
+
+
+class Lexer:
+    # analizator leksykalny: kazda klasa tokenow to automat (NFA lub DFA), wszystkie sa
+    # laczone ε-przejsciami i determinizowane do jednego DFA; tokenize wybiera najdluzsze
+    # dopasowanie, a przy rownej dlugosci klase o nizszym numerze (kolejnosc na liscie)
+    def __init__(self, token_classes, skip=()):
+        # token_classes: lista (nazwa, automat); skip: nazwy klas pomijanych (np. biale znaki)
+        self.names = [name for name, _ in token_classes]
+        self.skip = frozenset(self.names.index(name) for name in skip)
+
+        union, pattern_masks = union_of([automaton for _, automaton in token_classes])
+        dfa, tags = union.to_tagged_dfa(pattern_masks)
+        dfa.compile()
+        self._table = dfa._table
+        self._symbol_ids = dfa._symbol_ids
+        self._width = dfa._width
+        # dla przesuniecia wiersza stanu: numer rozpoznanej klasy albo -1
+        self._token_class = array('i', [-1]) * (len(dfa._final_flags) * self._width)
+        for state, patterns in enumerate(tags):
+            if patterns:
+                self._token_class[state * self._width] = min(patterns)
+        self._initial = dfa.initial_state * self._width
+
+    def tokenize(self, text):
+        # generator trojek (numer klasy, poczatek, koniec); LexerError przy nierozpoznanym znaku
+        table = self._table
+        symbol_ids = self._symbol_ids
+        token_class = self._token_class
+        skip = self.skip
+        length = len(text)
+        position = 0
+        while position < length:
+            offset = self._initial
+            matched_class = -1
+            matched_end = position
+            i = position
+            while i < length:
+                symbol = symbol_ids.get(text[i])
+                if symbol is None:
+                    break
+                offset = table[offset + symbol]
+                if offset < 0:
+                    break
+                i += 1
+                if token_class[offset] >= 0:
+                    matched_class = token_class[offset]
+                    matched_end = i
+            if matched_class < 0:
+                raise LexerError(position, text[position])
+            if matched_class not in skip:
+                yield matched_class, position, matched_end
+            position = matched_end
+
+    def token_names(self, text):
+        # same nazwy klas kolejnych tokenow (bez pomijanych)
+        names = self.names
+        return [names[token_class] for token_class, _, _ in self.tokenize(text)]
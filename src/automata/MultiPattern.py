@@ -0,0 +1,46 @@
+from .NFA import union_of
+
+NO_MATCH = frozenset()
+
+
+class MultiPattern:
+    # wiele automatow (NFA lub DFA) sprawdzanych jednym przebiegiem: suma automatow przez
+    # ε-przejscia, determinizacja, a kazdy stan DFA zna zbior spelnionych w nim wzorcow;
+    # koszt sprawdzenia napisu to O(len) zamiast O(N·len)
+    def __init__(self, automata, max_states=None):
+        union, pattern_masks = union_of(automata)
+        self.dfa, tags = union.to_tagged_dfa(pattern_masks, max_states)
+        self.dfa.compile()
+        self.number_of_patterns = len(pattern_masks)
+        # zbiory numerow wzorcow wg przesuniecia wiersza stanu w tablicy DFA
+        width = self.dfa._width
+        self._tags = {state * width: patterns for state, patterns in enumerate(tags) if patterns}
+
+    def matches(self, string):
+        # zbior numerow (kolejnosc na liscie automatow) wzorcow akceptujacych caly napis
+        dfa = self.dfa
+        table = dfa._table
+        symbol_ids = dfa._symbol_ids
+        offset = dfa.initial_state * dfa._width
+        for character in string:
+            symbol = symbol_ids.get(character)
+            if symbol is None:
+                return NO_MATCH
+            offset = table[offset + symbol]
+            if offset < 0:
+                return NO_MATCH
+        return self._tags.get(offset, NO_MATCH)
+
+    def matches_bytes(self, data):
+        dfa = self.dfa
+        table = dfa._table
+        byte_ids = dfa._byte_ids
+        offset = dfa.initial_state * dfa._width
+        for byte in data:
+            symbol = byte_ids[byte]
+            if symbol < 0:
+                return NO_MATCH
+            offset = table[offset + symbol]
+            if offset < 0:
+                return NO_MATCH
+        return self._tags.get(offset, NO_MATCH)
@@ -0,0 +1,551 @@
+"""
+Funkcje dla poszczególnych zadań wywołuje `python -m automata demo` (automata/__main__.py),
+import modułu nie zapisuje ani nie czyta żadnych plików.
+
+Dane:
+- plik 'nfa3.txt' zawiera automat do zadania 3. jako wejscie,
+- plik 'nfa4.txt' zawiera automat do zadań 4 i 5 jako wejscie
+
+Po wykonaniu dema utworzą się pliki:
+- 'dfa3.txt' jako wynik zadania 3.
+- 'nfa_no_eps.txt' jako wynik zadania 4.
+- 'dfa5.txt' jako wynik zadania 5.
+"""
+from collections import deque
+
+from .DFA import DFA, export_DFA_to_file, symbol_classes, useful_states
+from .LazyDFA import LazyDFA
+from .Instrumentation import Timer
+
+
+class StateLimitError(Exception):
+    # determinizacja przekroczyla zadany limit stanow DFA
+    def __init__(self, max_states):
+        super().__init__(f"determinizacja przekroczyla limit {max_states} stanow DFA")
+        self.max_states = max_states
+
+
+class NFA:
+    def __init__(self):
+        self.number_of_states = 0
+        self.initial_state = None
+        self.final_states = set()
+        self.transitions = {}  # Keys: (state, symbol); symbol==None dla epsilona
+        self._bitsets = None  # tablice masek bitowych dla accepts_bitset
+        self._closures = None  # ε-domkniecia wszystkich stanow, patrz epsilon_closures()
+
+    def add_state(self):
+        state = self.number_of_states
+        self.number_of_states += 1
+        self._bitsets = None
+        self._closures = None
+        return state
+
+    def mark_as_initial(self, state):
+        self.initial_state = state
+        self._bitsets = None
+
+    def mark_as_final(self, state):
+        self.final_states.add(state)
+        self._bitsets = None
+
+    def add_transition(self, state_from, character, state_to):
+        if (state_from, character) not in self.transitions:
+            self.transitions[(state_from, character)] = set()
+        self.transitions[(state_from, character)].add(state_to)
+        self._bitsets = None
+        if self._closures is not None and max(state_from, state_to) >= len(self._closures):
+            self._closures = None
+
+    def add_epsilon_transition(self, state_from, state_to):
+        if (state_from, None) not in self.transitions:
+            self.transitions[(state_from, None)] = set()
+        self.transitions[(state_from, None)].add(state_to)
+        self._bitsets = None
+        self._closures = None
+
+    def get_initial_state(self):
+        return self.initial_state
+
+    def get_target_states(self, state_from, character):
+        return self.transitions.get((state_from, character), set())
+
+    def is_final_state(self, state):
+        return state in self.final_states
+
+    def get_number_of_states(self):
+        return self.number_of_states
+
+    def _size(self):
+        # liczba stanow pokrywajaca tez stany uzyte w przejsciach bez add_state
+        size = self.number_of_states
+        for (state_from, _), targets in self.transitions.items():
+            size = max(size, state_from + 1, max(targets, default=-1) + 1)
+        if self.initial_state is not None:
+            size = max(size, self.initial_state + 1)
+        return size
+
+    def epsilon_closures(self):
+        # ε-domkniecia wszystkich stanow liczone raz i trzymane do nastepnej zmiany
+        # ε-przejsc (lub dodania stanu); maska bitowa, bit i <=> stan i
+        if self._closures is None:
+            self._closures = self._compute_epsilon_closures(self._size())
+        return self._closures
+
+    def epsilon_closure(self, states):
+        # ε-domkniecie zbioru stanow jako maska bitowa
+        closures = self.epsilon_closures()
+        closure = 0
+        for state in states:
+            closure |= closures[state]
+        return closure
+
+    def _compute_epsilon_closures(self, size):
+        # algorytm Tarjana na grafie ε-przejsc; silnie spojne skladowe zamykane sa
+        # w odwrotnym porzadku topologicznym, wiec domkniecie skladowej to jej stany
+        # plus domkniecia juz zamknietych skladowych, do ktorych prowadza ε-przejscia
+        edges = [()] * size
+        for (state_from, symbol), targets in self.transitions.items():
+            if symbol is None:
+                edges[state_from] = tuple(targets)
+
+        index = [-1] * size
+        low = [0] * size
+        on_stack = [False] * size
+        closures = [0] * size
+        stack = []
+        counter = 0
+
+        for root in range(size):
+            if index[root] >= 0:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(edges[root]))]
+            while work:
+                state, successors = work[-1]
+                for target in successors:
+                    if index[target] < 0:
+                        index[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, iter(edges[target])))
+                        break
+                    if on_stack[target]:
+                        low[state] = min(low[state], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[state])
+                    if low[state] != index[state]:
+                        continue
+                    members = []
+                    closure = 0
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        members.append(member)
+                        closure |= 1 << member
+                        if member == state:
+                            break
+                    for member in members:
+                        for target in edges[member]:
+                            closure |= closures[target]
+                    for member in members:
+                        closures[member] = closure
+        return closures
+
+    def compile_bitsets(self):
+        # zbiory stanow jako int-y: dla kazdego symbolu lista masek nastepnikow stanu
+        # (juz po ε-domknieciu), wiec krok symulacji to kilka operacji OR; symbole
+        # o identycznych listach tworza klase i wspoldziela jedna liste
+        size = self._size()
+        closures = self.epsilon_closures()
+
+        successors = {}
+        for (state_from, symbol), targets in self.transitions.items():
+            if symbol is None:
+                continue
+            if symbol not in successors:
+                successors[symbol] = [0] * size
+            mask = 0
+            for state_to in targets:
+                mask |= closures[state_to]
+            successors[symbol][state_from] |= mask
+
+        symbols = sorted(successors)
+        symbol_class, number_of_classes = symbol_classes(
+            symbols, (((state, symbol), mask) for symbol in symbols
+                      for state, mask in enumerate(successors[symbol]) if mask))
+        classes = [[] for _ in range(number_of_classes)]
+        for symbol, class_id in zip(symbols, symbol_class):
+            classes[class_id].append(symbol)
+            successors[symbol] = successors[classes[class_id][0]]
+
+        final_mask = 0
+        for state in self.final_states:
+            final_mask |= 1 << state
+
+        # indeks przejsc per stan: tylko klasy symboli, ktore faktycznie wychodza ze stanu
+        outgoing = [[] for _ in range(size)]
+        for class_id, members in enumerate(classes):
+            for state, mask in enumerate(successors[members[0]]):
+                if mask:
+                    outgoing[state].append((class_id, mask))
+
+        initial_mask = closures[self.initial_state] if self.initial_state is not None else 0
+        self._bitsets = (initial_mask, successors, final_mask, outgoing, classes)
+        return self
+
+    def accepts_bitset(self, string):
+        # symulacja na maskach bitowych zamiast zbiorow stanow
+        if self._bitsets is None:
+            self.compile_bitsets()
+        current, successors, final_mask, _, _ = self._bitsets
+        for character in string:
+            step = successors.get(character)
+            if step is None:
+                return False
+            next_states = 0
+            remaining = current
+            while remaining:
+                lowest = remaining & -remaining
+                next_states |= step[lowest.bit_length() - 1]
+                remaining ^= lowest
+            current = next_states
+            if not current:
+                return False
+        return bool(current & final_mask)
+
+    def accepts(self, string, stats=None):
+        # zbiory stanow jako maski bitowe, ε-domkniecia brane z tablicy epsilon_closures();
+        # stats (SimulationStats) zbiera liczbe aktywnych stanow na kazdej pozycji
+        if stats is not None:
+            return self._accepts_instrumented(string, stats)
+        closures = self.epsilon_closures()
+        if self.initial_state is None:
+            return False
+        current_states = closures[self.initial_state]
+        for character in string:
+            next_states = 0
+            # Dla każdego stanu, w którym się znajduje pobieram możliwe przejścia dla aktualnie przetwarzanego symbolu
+            for state in _states_of(current_states):
+                for target in self.transitions.get((state, character), ()):
+                    next_states |= closures[target]
+            current_states = next_states
+            if not current_states:
+                return False
+        return any(state in self.final_states for state in _states_of(current_states))
+
+    def _accepts_instrumented(self, string, stats):
+        # ta sama symulacja co accepts, osobna petla, zeby bez stats nie bylo narzutu
+        closures = self.epsilon_closures()
+        if self.initial_state is None:
+            return False
+        current_states = closures[self.initial_state]
+        stats._record(0, current_states)
+        for position, character in enumerate(string, 1):
+            next_states = 0
+            for state in _states_of(current_states):
+                for target in self.transitions.get((state, character), ()):
+                    next_states |= closures[target]
+            current_states = next_states
+            stats._record(position, current_states)
+            if not current_states:
+                return False
+        return any(state in self.final_states for state in _states_of(current_states))
+
+    def to_dfa(self, max_states=None, minimize=False, trim=False, stats=None):
+        # determinizacja; max_states przerywa wybuch wykladniczy, minimize=True konczy
+        # minimalizacja Hopcrofta, trim=True usuwa podzbiory bez drogi do stanu koncowego,
+        # stats (ConstructionStats) zbiera liczniki konstrukcji podzbiorow
+        dfa, _ = self._subset_construction(max_states, stats)
+        if minimize:
+            dfa = dfa.minimize()
+        return dfa.trim() if trim else dfa
+
+    def to_tagged_dfa(self, pattern_masks, max_states=None, stats=None):
+        # determinizacja z etykietami: pattern_masks[i] to maska stanow koncowych wzorca i,
+        # wynik to (DFA, lista zbiorow numerow wzorcow spelnionych w kazdym stanie DFA)
+        dfa, subsets = self._subset_construction(max_states, stats)
+        tags = [frozenset(pattern for pattern, mask in enumerate(pattern_masks) if subset & mask)
+                for subset in subsets]
+        return dfa, tags
+
+    def _subset_construction(self, max_states, stats=None):
+        # konstrukcja podzbiorow bezposrednio na ε-NFA; podzbior to ε-domknieta maska
+        # bitowa (klucz slownika), kolejka to deque, a dla podzbioru odwiedzane sa tylko
+        # klasy symboli wychodzace z jego stanow (nastepnik liczony raz na klase);
+        # zwraca (DFA, maski podzbiorow kolejnych stanow)
+        if stats is None:
+            return self._subset_loop(max_states, None)
+        with Timer(stats, "total_seconds"):
+            if self._bitsets is None:
+                with Timer(stats, "epsilon_closure_seconds"):
+                    self.epsilon_closures()
+            return self._subset_loop(max_states, stats)
+
+    def _subset_loop(self, max_states, stats):
+        # liczniki stats aktualizowane sa raz na podzbior, nie na przejscie
+        if self._bitsets is None:
+            self.compile_bitsets()
+        initial_mask, _, final_mask, outgoing, classes = self._bitsets
+
+        dfa = DFA()
+        if self.initial_state is None:
+            return dfa, []
+        dfa_state_map = {initial_mask: dfa.add_state()}
+        dfa.mark_as_initial(0)
+        unprocessed = deque([initial_mask])
+        if stats is not None:
+            stats._state_created(initial_mask)
+
+        while unprocessed:
+            current_subset = unprocessed.popleft()
+            current_id = dfa_state_map[current_subset]
+            if current_subset & final_mask:
+                dfa.mark_as_final(current_id)
+
+            next_subsets = {}
+            for state in _states_of(current_subset):
+                for class_id, mask in outgoing[state]:
+                    next_subsets[class_id] = next_subsets.get(class_id, 0) | mask
+
+            if stats is not None:
+                stats.alphabet_iterations += len(next_subsets)
+            for class_id, next_subset in next_subsets.items():
+                target = dfa_state_map.get(next_subset)
+                if target is None:
+                    if max_states is not None and len(dfa_state_map) >= max_states:
+                        raise StateLimitError(max_states)
+                    target = dfa_state_map[next_subset] = dfa.add_state()
+                    unprocessed.append(next_subset)
+                    if stats is not None:
+                        stats._state_created(next_subset)
+                for symbol in classes[class_id]:
+                    dfa.add_transition(current_id, symbol, target)
+                if stats is not None:
+                    stats.transitions_created += len(classes[class_id])
+        return dfa, list(dfa_state_map)
+
+    def lazy_dfa(self, max_states=1024):
+        # DFA budowany leniwie w czasie dopasowania, patrz LazyDFA
+        return LazyDFA(self, max_states)
+
+    def trim(self):
+        # usuniecie stanow nieosiagalnych i stanow, z ktorych nie da sie dojsc do stanu
+        # koncowego (ε-przejscia tez sa krawedziami); zwraca nowy NFA, stan poczatkowy to 0
+        trimmed = NFA()
+        if self.initial_state is None:
+            return trimmed
+        order = useful_states(self.initial_state, self.final_states,
+                              ((state_from, state_to) for (state_from, _), targets in self.transitions.items()
+                               for state_to in targets))
+        numbering = {state: trimmed.add_state() for state in order}
+        trimmed.mark_as_initial(0)
+        for (state_from, symbol), targets in self.transitions.items():
+            if state_from not in numbering:
+                continue
+            kept = {numbering[state_to] for state_to in targets if state_to in numbering}
+            if kept:
+                trimmed.transitions[(numbering[state_from], symbol)] = kept
+        for state in self.final_states:
+            if state in numbering:
+                trimmed.mark_as_final(numbering[state])
+        return trimmed
+
+    def without_epsilon_transitions(self, trim=False):
+        # rownowazny automat bez ε-przejsc: s -a-> domkniecie(d) dla kazdego d
+        # osiagalnego przez a z dowolnego stanu domkniecia(s); trim=True usuwa stany
+        # nieosiagalne (np. osiagalne wczesniej tylko przez ε) i bez drogi do stanu koncowego
+        size = self._size()
+        closures = self.epsilon_closures()
+
+        # indeks przejsc stanu: symbol -> maska celow juz po ε-domknieciu
+        successors = [{} for _ in range(size)]
+        for (state_from, symbol), targets in self.transitions.items():
+            if symbol is None:
+                continue
+            mask = successors[state_from].get(symbol, 0)
+            for state_to in targets:
+                mask |= closures[state_to]
+            successors[state_from][symbol] = mask
+
+        final_mask = 0
+        for state in self.final_states:
+            final_mask |= 1 << state
+
+        new_nfa = NFA()
+        for _ in range(size):
+            new_nfa.add_state()
+        new_nfa.mark_as_initial(self.initial_state)
+
+        for s in range(size):
+            destinations = {}
+            for t in _states_of(closures[s]):
+                for symbol, mask in successors[t].items():
+                    destinations[symbol] = destinations.get(symbol, 0) | mask
+            for symbol, mask in destinations.items():
+                new_nfa.transitions[(s, symbol)] = set(_states_of(mask))
+            if closures[s] & final_mask:
+                new_nfa.mark_as_final(s)
+        return new_nfa.trim() if trim else new_nfa
+
+    def matcher(self):
+        # dopasowanie przyrostowe (porcjami), patrz NFAMatcher
+        return NFAMatcher(self)
+
+
+class NFAMatcher:
+    # wznawialne dopasowanie NFA: miedzy kolejnymi feed() pamietana jest tylko maska
+    # biezacych stanow; uzywa tablic z compile_bitsets() w chwili utworzenia
+    def __init__(self, nfa):
+        if nfa._bitsets is None:
+            nfa.compile_bitsets()
+        self._initial, self._successors, self._final_mask, _, _ = nfa._bitsets
+        self._current = self._initial
+
+    def reset(self):
+        self._current = self._initial
+        return self
+
+    def feed(self, chunk):
+        # chunk to str albo bytes/bytearray/memoryview (bajty jako znaki latin-1)
+        current = self._current
+        if not current:
+            return self
+        successors = self._successors
+        for character in chunk:
+            if not isinstance(character, str):
+                character = chr(character)
+            step = successors.get(character)
+            if step is None:
+                current = 0
+                break
+            next_states = 0
+            while current:
+                lowest = current & -current
+                next_states |= step[lowest.bit_length() - 1]
+                current ^= lowest
+            current = next_states
+            if not current:
+                break
+        self._current = current
+        return self
+
+    def is_dead(self):
+        return not self._current
+
+    def is_accepting(self):
+        return bool(self._current & self._final_mask)
+
+
+def union_of(automata):
+    # suma jezykow automatow (NFA lub DFA): nowy stan poczatkowy 0 z ε-przejsciami do
+    # przenumerowanych kopii; zwraca (NFA, maski stanow koncowych kolejnych automatow)
+    union = NFA()
+    union.mark_as_initial(union.add_state())
+    pattern_masks = []
+    for automaton in automata:
+        offset = union.number_of_states
+        edges = [(state_from, symbol, state_to)
+                 for (state_from, symbol), targets in automaton.transitions.items()
+                 for state_to in (targets if isinstance(targets, (set, frozenset)) else (targets,))]
+        size = max([automaton.get_number_of_states(), 1]
+                   + [max(state_from, state_to) + 1 for state_from, _, state_to in edges]
+                   + [state + 1 for state in automaton.final_states])
+        for _ in range(size):
+            union.add_state()
+        for state_from, symbol, state_to in edges:
+            if symbol is None:
+                union.add_epsilon_transition(offset + state_from, offset + state_to)
+            else:
+                union.add_transition(offset + state_from, symbol, offset + state_to)
+        mask = 0
+        for state in automaton.final_states:
+            union.mark_as_final(offset + state)
+            mask |= 1 << (offset + state)
+        pattern_masks.append(mask)
+        if automaton.get_initial_state() is not None:
+            union.add_epsilon_transition(0, offset + automaton.get_initial_state())
+    return union, pattern_masks
+
+
+def _states_of(mask):
+    # numery stanow zapalonych bitow maski, rosnaco
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+""" Czytanie nfa z pliku """
+def import_NFA_from_file(file, trim=False):
+    # plik czytany strumieniowo linia po linii, zbiory celow trafiaja od razu do slownika
+    # przejsc, a liczba stanow ustawiana jest raz na koncu; trim=True usuwa zbedne stany
+    # (NFA.trim)
+    nfa = NFA()
+    transitions = nfa.transitions
+    final_states = nfa.final_states
+    max_state = -1
+
+    with open(file, 'r') as f:
+        for line_number, line in enumerate(f, 1):
+            parts = line.split()
+            try:
+                if len(parts) == 3:
+                    state_from, state_to, character = int(parts[0]), int(parts[1]), parts[2]
+                    if character == "<eps>":
+                        character = None
+                    targets = transitions.get((state_from, character))
+                    if targets is None:
+                        transitions[(state_from, character)] = {state_to}
+                    else:
+                        targets.add(state_to)
+                    if state_from > max_state:
+                        max_state = state_from
+                    if state_to > max_state:
+                        max_state = state_to
+                elif len(parts) == 1:
+                    state = int(parts[0])
+                    final_states.add(state)
+                    if state > max_state:
+                        max_state = state
+                elif parts:  # pomija puste linie
+                    raise ValueError(f"oczekiwano 'stan stan symbol' albo 'stan', jest {len(parts)} pol")
+            except ValueError as error:
+                raise ValueError(f"{file}:{line_number}: niepoprawna linia {line.rstrip()!r}: {error}") from None
+
+    nfa.number_of_states = max_state + 1
+    nfa.mark_as_initial(0)
+    return nfa.trim() if trim else nfa
+
+
+def remove_epsilon_transitions(input_file, output_file, trim=False):    # zadanie 4
+    nfa = import_NFA_from_file(input_file, trim)
+    new_nfa = nfa.without_epsilon_transitions(trim)
+
+    with open(output_file, 'w') as f:
+        for (state, symbol), targets in new_nfa.transitions.items():
+            if symbol is not None:
+                for state_to in targets:
+                    f.write(f"{state} {state_to} {symbol}\n")
+        for state in sorted(new_nfa.final_states):
+            f.write(f"{state}\n")
+
+
+def convert_nfa_to_dfa(input_file, output_file, max_states=None, minimize=False, trim=False, stats=None):  # determinizacja nfa bez przejsc epsilonowych
+    nfa = import_NFA_from_file(input_file, trim)
+    export_DFA_to_file(nfa.to_dfa(max_states, minimize, trim, stats), output_file)
+
+
+def convert_nfa_with_epsilon_to_dfa(input_file, minimize=False, trim=False, stats=None):  # zadanie 5
+    # determinizacja ε-NFA w pamieci (NFA.to_dfa), zapis tylko wyniku
+    dfa = "dfa5.txt"
+    nfa = import_NFA_from_file(input_file, trim)
+    export_DFA_to_file(nfa.to_dfa(minimize=minimize, trim=trim, stats=stats), dfa)
+
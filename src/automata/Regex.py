@@ -0,0 +1,259 @@
+from .NFA import NFA
+
+# wyrazenia regularne -> NFA konstrukcja Glushkova: stan na kazda pozycje (wystapienie
+# klasy znakow) we wzorcu plus stan poczatkowy, bez zadnych ε-przejsc
+#
+# skladnia: konkatenacja, |, *, +, ?, {m}, {m,}, {m,n}, nawiasy ( ), klasy [a-z0-9_],
+# [^...], . (dowolny drukowalny znak ASCII), \d \w \s oraz \ przed znakiem specjalnym
+#
+# uwaga: '.' i klasy zanegowane [^...] obejmuja tylko drukowalne znaki ASCII (32-126) -
+# nie dopasowuja znakow spoza ASCII, tabulacji ani konca linii
+
+PRINTABLE = frozenset(chr(code) for code in range(32, 127))
+DIGITS = frozenset('0123456789')
+WORD = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+SPACE = frozenset(' \t\n\r\f\v')
+ESCAPES = {'d': DIGITS, 'w': WORD, 's': SPACE, 'n': frozenset('\n'), 't': frozenset('\t')}
+MAX_REPEAT = 1000
+
+
+class RegexError(ValueError):
+    def __init__(self, pattern, position, message):
+        super().__init__(f"{message} na pozycji {position}: {pattern!r}")
+        self.pattern = pattern
+        self.position = position
+
+
+class _Parser:
+    # zejscie rekurencyjne; drzewo z krotek:
+    # ('chars', frozenset), ('empty',), ('cat', a, b), ('alt', a, b), ('star', a),
+    # ('plus', a), ('opt', a)
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.position = 0
+
+    def error(self, message, position=None):
+        return RegexError(self.pattern, self.position if position is None else position, message)
+
+    def peek(self):
+        return self.pattern[self.position] if self.position < len(self.pattern) else None
+
+    def parse(self):
+        tree = self.alternation()
+        if self.position < len(self.pattern):
+            raise self.error("niesparowany nawias ')'")
+        return tree
+
+    def alternation(self):
+        tree = self.concatenation()
+        while self.peek() == '|':
+            self.position += 1
+            tree = ('alt', tree, self.concatenation())
+        return tree
+
+    def concatenation(self):
+        tree = ('empty',)
+        while self.peek() not in (None, '|', ')'):
+            factor = self.repetition()
+            tree = factor if tree == ('empty',) else ('cat', tree, factor)
+        return tree
+
+    def repetition(self):
+        tree = self.atom()
+        while self.peek() in ('*', '+', '?', '{'):
+            operator = self.peek()
+            if operator == '{':
+                tree = self.counted(tree)
+                continue
+            self.position += 1
+            tree = ({'*': 'star', '+': 'plus', '?': 'opt'}[operator], tree)
+        return tree
+
+    def counted(self, tree):
+        # {m}, {m,}, {m,n} rozwijane do konkatenacji kopii poddrzewa
+        start = self.position
+        self.position += 1
+        low = self.number()
+        high = low
+        if self.peek() == ',':
+            self.position += 1
+            high = None if self.peek() == '}' else self.number()
+        if self.peek() != '}':
+            raise self.error("oczekiwano '}'")
+        self.position += 1
+        if high is not None and high < low:
+            raise self.error("dolna granica powtorzen wieksza od gornej", start)
+        if max(low, high or 0) > MAX_REPEAT:
+            raise self.error(f"liczba powtorzen powyzej {MAX_REPEAT}", start)
+        result = ('empty',)
+        for _ in range(low):
+            result = tree if result == ('empty',) else ('cat', result, tree)
+        if high is None:
+            tail = ('star', tree)
+        else:
+            # x{0,k} jako (x(x(...)?)?)? - bez wykladniczego przyrostu alternatyw
+            tail = ('empty',)
+            for _ in range(high - low):
+                tail = ('opt', tree if tail == ('empty',) else ('cat', tree, tail))
+        if tail == ('empty',):
+            return result
+        return tail if result == ('empty',) else ('cat', result, tail)
+
+    def number(self):
+        start = self.position
+        while self.peek() is not None and self.peek().isdigit():
+            self.position += 1
+        if start == self.position:
+            raise self.error("oczekiwano liczby")
+        return int(self.pattern[start:self.position])
+
+    def atom(self):
+        character = self.peek()
+        if character is None:
+            raise self.error("nieoczekiwany koniec wzorca")
+        if character == '(':
+            start = self.position
+            self.position += 1
+            tree = self.alternation()
+            if self.peek() != ')':
+                raise self.error("niezamkniety nawias '('", start)
+            self.position += 1
+            return tree
+        if character == '[':
+            return ('chars', self.character_class())
+        if character == '.':
+            self.position += 1
+            return ('chars', PRINTABLE)
+        if character == '\\':
+            return ('chars', self.escape())
+        if character in ('*', '+', '?', '{'):
+            raise self.error(f"operator {character!r} bez argumentu")
+        if character in (')', ']', '}'):
+            raise self.error(f"niesparowany znak {character!r}")
+        self.position += 1
+        return ('chars', frozenset(character))
+
+    def escape(self):
+        self.position += 1
+        character = self.peek()
+        if character is None:
+            raise self.error("'\\' na koncu wzorca")
+        self.position += 1
+        if character in ESCAPES:
+            return ESCAPES[character]
+        if character.isalnum():
+            raise self.error(f"nieznana sekwencja '\\{character}'", self.position - 2)
+        return frozenset(character)
+
+    def character_class(self):
+        start = self.position
+        self.position += 1
+        negated = self.peek() == '^'
+        if negated:
+            self.position += 1
+        characters = set()
+        first = True
+        while True:
+            character = self.peek()
+            if character is None:
+                raise self.error("niezamknieta klasa znakow '['", start)
+            if character == ']' and not first:
+                self.position += 1
+                break
+            first = False
+            if character == '\\':
+                low = self.escape()
+            else:
+                self.position += 1
+                low = frozenset(character)
+            if self.peek() == '-' and self.position + 1 < len(self.pattern) \
+                    and self.pattern[self.position + 1] != ']':
+                self.position += 1
+                if self.peek() == '\\':
+                    high = self.escape()
+                else:
+                    high = frozenset(self.peek())
+                    self.position += 1
+                if len(low) != 1 or len(high) != 1 or min(low) > min(high):
+                    raise self.error("niepoprawny zakres w klasie znakow", start)
+                low = frozenset(chr(code) for code in range(ord(min(low)), ord(min(high)) + 1))
+            characters |= low
+        if negated:
+            return PRINTABLE - characters
+        return frozenset(characters)
+
+
+def parse_regex(pattern):
+    parser = _Parser(pattern)
+    try:
+        return parser.parse()
+    except RecursionError:
+        raise parser.error("zbyt gleboko zagniezdzone nawiasy") from None
+
+
+def regex_to_nfa(pattern):
+    # NFA Glushkova dla wzorca (dopasowanie calego napisu); RegexError przy bledzie skladni
+    tree = parse_regex(pattern)
+    nfa = NFA()
+    initial = nfa.add_state()
+    nfa.mark_as_initial(initial)
+
+    # dla kazdego poddrzewa: (wymazywalne, pozycje pierwsze, pozycje ostatnie); przejscia
+    # follow dodawane sa od razu - pozycja p ma krawedzie do pozycji q po znakach klasy q
+    positions = {}  # pozycja (stan) -> zbior znakow
+
+    def connect(sources, targets):
+        for source in sources:
+            for target in targets:
+                for character in positions[target]:
+                    nfa.add_transition(source, character, target)
+
+    def combine(node, results):
+        kind = node[0]
+        if kind == 'alt':
+            (left_nullable, left_first, left_last), (right_nullable, right_first, right_last) = results
+            return left_nullable or right_nullable, left_first + right_first, left_last + right_last
+        if kind == 'cat':
+            (left_nullable, left_first, left_last), (right_nullable, right_first, right_last) = results
+            connect(left_last, right_first)
+            first = left_first + right_first if left_nullable else left_first
+            last = left_last + right_last if right_nullable else right_last
+            return left_nullable and right_nullable, first, last
+        ((nullable, first, last),) = results
+        if kind in ('star', 'plus'):
+            connect(last, first)
+        return nullable or kind != 'plus', first, last
+
+    def build(tree):
+        # przejscie post-order z jawnym stosem - drzewa z {m,n} i dlugich literalow sa
+        # glebokie (lewostronne 'cat'), rekurencja przekroczylaby limit Pythona
+        results = []
+        stack = [(tree, False)]
+        while stack:
+            node, children_done = stack.pop()
+            kind = node[0]
+            if kind == 'empty':
+                results.append((True, (), ()))
+            elif kind == 'chars':
+                state = nfa.add_state()
+                positions[state] = node[1]
+                results.append((False, (state,), (state,)))
+            elif children_done:
+                arity = len(node) - 1
+                children = results[-arity:]
+                del results[-arity:]
+                results.append(combine(node, children))
+            else:
+                stack.append((node, True))
+                # dzieci odkladane od prawej, zeby pozycje (stany) byly numerowane od lewej
+                for child in reversed(node[1:]):
+                    stack.append((child, False))
+        return results[0]
+
+    nullable, first, last = build(tree)
+    connect((initial,), first)
+    for state in last:
+        nfa.mark_as_final(state)
+    if nullable:
+        nfa.mark_as_final(initial)
+    return nfa
@@ -0,0 +1,336 @@
+from array import array
+from functools import partial
+from itertools import repeat
+
+from .DFA import DFA
+
+CHUNK = 1 << 16  # tyle znakow tekstu czytane jest naraz (jako klasy symboli)
+MAX_CACHED_STATES = 4096  # limit stanow leniwych automatow jednego przeszukania
+
+# stany tworzone w _LazyTable zawsze jako pierwsze
+_START = 0
+_DEAD = 1
+
+
+class _LazyTable:
+    # automat deterministyczny budowany w trakcie przeszukania: stan to klucz (krotka albo
+    # maska stanow DFA wzorca), a wiersz przejsc wypelniany jest przy pierwszym uzyciu
+    # pary (stan, klasa symboli); -1 w wierszu to przejscie jeszcze nie policzone
+    def __init__(self, successor, accepting, width, start, dead):
+        self._successor = successor
+        self._accepting = accepting
+        self._width = width
+        self._roots = (start, dead)
+        self.keys = []
+        self.ids = {}
+        self.rows = []
+        self.flags = []
+        self.flushes = 0
+        for key in self._roots:
+            self._state(key)
+
+    def _state(self, key):
+        state = self.ids.get(key)
+        if state is None:
+            state = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.rows.append([-1] * self._width)
+            self.flags.append(self._accepting(key))
+        return state
+
+    def step(self, state, symbol):
+        key = self._successor(self.keys[state], symbol)
+        if len(self.keys) >= MAX_CACHED_STATES and key not in self.ids:
+            # za duzo stanow - tablica budowana od nowa (korzenie zachowuja numery); listy
+            # czyszczone sa w miejscu, wiec referencje trzymane w petlach pozostaja wazne
+            self.keys.clear()
+            self.ids.clear()
+            self.rows.clear()
+            self.flags.clear()
+            self.flushes += 1
+            for root in self._roots:
+                self._state(root)
+            return self._state(key)
+        target = self.rows[state][symbol] = self._state(key)
+        return target
+
+
+class _Window:
+    # ostatnio przeczytany fragment tekstu (do CHUNK znakow) zamieniony na klasy symboli;
+    # kolejne przebiegi i przebieg wsteczny korzystaja z niego bez ponownego czytania tekstu
+    def __init__(self, read, length):
+        self.read = read
+        self.length = length
+        self.start = 0
+        self.symbols = ()
+
+    def at(self, position):
+        # (klasy symboli, indeks pozycji position w nich)
+        offset = position - self.start
+        if not 0 <= offset < len(self.symbols):
+            self.start = position
+            self.symbols = self.read(position, min(position + CHUNK, self.length))
+            offset = 0
+        return self.symbols, offset
+
+    def between(self, start, stop):
+        if self.start <= start and stop <= self.start + len(self.symbols):
+            return self.symbols[start - self.start:stop - self.start]
+        return self.read(start, stop)
+
+
+class _Trace:
+    # stany zapamietane z poprzednich przebiegow: dla pozycji p stan automatu po
+    # przeczytaniu tekstu do p oraz ostatni koniec dopasowania tamtego przebiegu na pozycji
+    # >= p (-1 gdy nie bylo); przebieg, ktory na pozycji p jest w tym samym stanie, ma te
+    # sama przyszlosc i moze skonczyc sie od razu - stala pamiec na pozycje
+    def __init__(self):
+        self.base = 0
+        self.states = []
+        self.lasts = []
+
+    def clear(self):
+        self.base = 0
+        self.states = []
+        self.lasts = []
+
+    def record(self, start, states, last, accepting):
+        # states to stany przebiegu na pozycjach start, start + 1, ...; last to ostatni
+        # koniec dopasowania za nimi
+        lasts = []
+        for index in range(len(states) - 1, -1, -1):
+            if last < 0 and accepting[states[index]]:
+                last = start + index
+            lasts.append(last)
+        lasts.reverse()
+        offset = start - self.base
+        if offset > len(self.states) // 2:
+            # pozycje przed start nie beda juz sprawdzane (przebiegi ida w prawo)
+            keep = max(len(self.states) - offset, 0)
+            self.states = self.states[len(self.states) - keep:]
+            self.lasts = self.lasts[len(self.lasts) - keep:]
+            self.base = start
+            offset = 0
+        self.states[offset:offset + len(states)] = states
+        self.lasts[offset:offset + len(lasts)] = lasts
+
+
+class Searcher:
+    # wyszukiwanie wszystkich wystapien slow jezyka automatu w tekscie (semantyka
+    # leftmost-longest, bez nakladania sie i bez dopasowan pustych)
+    #
+    # Tekst czytany jest od lewej przez DFA dla Σ*·R (petla Σ* przed wzorcem), budowany
+    # leniwie: stan to uporzadkowana wg poczatku lista stanow DFA wzorca (watki w tym samym
+    # stanie sa laczone z zachowaniem wczesniejszego poczatku), wiec na znak przypada jedno
+    # przejscie tablicy. Po pierwszym koncu dopasowania nowe watki nie startuja, a watki
+    # zaczete pozniej niz najwczesniejszy dopasowany sa odrzucane - ostatnia pozycja, w
+    # ktorej automat akceptuje, to koniec dopasowania leftmost-longest. Poczatek znajduje
+    # DFA odwroconego wzorca czytajacy tekst wstecz od tego konca.
+    #
+    # Przebieg trwa, dopoki zyja watki mogace wydluzyc dopasowanie; zeby tekst za
+    # dopasowaniem nie byl przegladany wielokrotnie (np. a*b|a na samych 'a'), stany
+    # przebiegow sa zapamietywane i kolejny przebieg konczy sie, gdy trafi na ten sam stan
+    # na tej samej pozycji.
+    #
+    # Tekst to str albo bytes/bytearray/memoryview/mmap (bajty jako znaki latin-1) - duzy
+    # plik mozna przeszukac przez mmap bez wczytywania go w calosci.
+    def __init__(self, automaton):
+        dfa = automaton if isinstance(automaton, DFA) else automaton.to_dfa()
+        dfa.compile()
+        self.dfa = dfa
+        table = dfa._table
+        classes = dfa._number_of_classes
+        size = len(dfa._final_flags)
+        self._width = classes + 1
+        self._other = classes  # klasa znakow spoza alfabetu - zawsze stan martwy
+        self._final = [flag == 1 for flag in dfa._final_flags]
+        self._initial = dfa.initial_state
+
+        # stany, z ktorych nie da sie dojsc do koncowego, traktowane sa jak martwe
+        targets = [[-1] * self._width for _ in range(size)]
+        sources = [[] for _ in range(size)]
+        for state in range(size):
+            for symbol in range(classes):
+                offset = table[state * dfa._width + symbol]
+                if offset >= 0:
+                    targets[state][symbol] = offset // dfa._width
+                    sources[offset // dfa._width].append(state)
+        queue = [state for state in range(size) if self._final[state]]
+        final_mask = useful = sum(1 << state for state in queue)
+        while queue:
+            for source in sources[queue.pop()]:
+                if not useful >> source & 1:
+                    useful |= 1 << source
+                    queue.append(source)
+        self._next = [[target if target >= 0 and useful >> target & 1 else -1 for target in row]
+                      for row in targets]
+        self._predecessors = [[0] * size for _ in range(self._width)]
+        for state in range(size):
+            if useful >> state & 1:
+                for symbol, target in enumerate(self._next[state]):
+                    if target >= 0:
+                        self._predecessors[symbol][target] |= 1 << state
+        self._final_mask = final_mask
+        self._no_match = self._initial is None or not useful >> self._initial & 1
+
+        self._symbol_ids = dfa._symbol_ids
+        self._byte_ids = [self._other if symbol < 0 else symbol for symbol in dfa._byte_ids]
+        self._byte_table = bytes(self._byte_ids) if self._width <= 256 else None
+
+    def _forward_successor(self, key, symbol):
+        threads, matched = key
+        if not matched:
+            threads += (self._initial,)
+        following = []
+        for state in threads:
+            target = self._next[state][symbol]
+            if target >= 0 and target not in following:
+                following.append(target)
+                if self._final[target]:
+                    # watki zaczete pozniej niz ten nie moga juz wygrac
+                    return tuple(following), True
+        return tuple(following), matched
+
+    def _forward_accepting(self, key):
+        return any(self._final[state] for state in key[0])
+
+    def _reverse_successor(self, mask, symbol):
+        predecessors = self._predecessors[symbol]
+        result = 0
+        while mask:
+            lowest = mask & -mask
+            result |= predecessors[lowest.bit_length() - 1]
+            mask ^= lowest
+        return result
+
+    def _reverse_accepting(self, mask):
+        return bool(mask >> self._initial & 1)
+
+    def _reader(self, text):
+        # funkcja (poczatek, koniec) -> klasy symboli znakow text[poczatek:koniec] jako
+        # memoryview (wycinki bez kopiowania)
+        byte_table = self._byte_table
+        if isinstance(text, str):
+            symbol_of = self._symbol_ids.get
+            other = repeat(self._other)
+            pack = bytes if byte_table is not None else partial(array, 'i')
+
+            def read(start, stop):
+                return memoryview(pack(map(symbol_of, text[start:stop], other)))
+        elif byte_table is not None:
+            def read(start, stop):
+                return memoryview(bytes(text[start:stop]).translate(byte_table))
+        else:
+            byte_ids = self._byte_ids
+
+            def read(start, stop):
+                return memoryview(array('i', [byte_ids[byte] for byte in text[start:stop]]))
+        return read
+
+    def _longest_end(self, window, position, forward, trace):
+        # koniec dopasowania leftmost-longest zaczynajacego sie od position albo dalej
+        # (-1 gdy nie ma zadnego)
+        rows = forward.rows
+        accepting = forward.flags
+        flushes = forward.flushes
+        state = _START
+        first = last = future = -1
+        visited = []  # stany na pozycjach first, first + 1, ...
+        position_now = position
+        while position_now < window.length:
+            symbols, offset = window.at(position_now)
+            if first < 0:
+                # petla Σ*: jedno przejscie na znak az do pierwszego konca dopasowania
+                for end, symbol in enumerate(symbols[offset:], position_now + 1):
+                    target = rows[state][symbol]
+                    if target < 0:
+                        target = forward.step(state, symbol)
+                    state = target
+                    if accepting[state]:
+                        first = last = end
+                        break
+                else:
+                    position_now += len(symbols) - offset
+                    continue
+                visited.append(state)
+                offset += first - position_now
+                position_now = first
+            base = trace.base
+            traced = trace.states
+            for end, symbol in enumerate(symbols[offset:], position_now + 1):
+                target = rows[state][symbol]
+                if target < 0:
+                    target = forward.step(state, symbol)
+                state = target
+                if state == _DEAD:
+                    break
+                index = end - base
+                if 0 <= index < len(traced) and traced[index] == state:
+                    future = trace.lasts[index]
+                    break
+                visited.append(state)
+                if accepting[state]:
+                    last = end
+            else:
+                position_now += len(symbols) - offset
+                continue
+            break
+        if first < 0:
+            return -1
+        if forward.flushes != flushes:
+            # numery stanow zmienily sie w trakcie przebiegu
+            trace.clear()
+        elif len(visited) > 16:
+            # krotkiego przebiegu nie warto zapamietywac - kolejny przeczyta ponownie
+            # najwyzej kilka znakow
+            trace.record(first, visited, future, accepting)
+        return future if future >= 0 else last
+
+    def _leftmost_start(self, window, position, end, reverse):
+        # najmniejszy poczatek >= position dopasowania konczacego sie w end: DFA
+        # odwroconego wzorca czyta tekst wstecz od end, az zginie albo dojdzie do position
+        rows = reverse.rows
+        accepting = reverse.flags
+        state = _START
+        start = -1
+        stop = end
+        block = 64
+        while stop > position:
+            begin = max(position, stop - block)
+            symbols = window.between(begin, stop)
+            for index in range(len(symbols) - 1, -1, -1):
+                symbol = symbols[index]
+                target = rows[state][symbol]
+                if target < 0:
+                    target = reverse.step(state, symbol)
+                state = target
+                if state == _DEAD:
+                    return start
+                if accepting[state]:
+                    start = begin + index
+            stop = begin
+            block = min(block * 2, CHUNK)
+        return start
+
+    def finditer(self, text):
+        # generator par (poczatek, koniec) kolejnych dopasowan
+        if self._no_match:
+            return
+        forward = _LazyTable(self._forward_successor, self._forward_accepting, self._width,
+                             ((), False), ((), True))
+        reverse = _LazyTable(self._reverse_successor, self._reverse_accepting, self._width,
+                             self._final_mask, 0)
+        window = _Window(self._reader(text), len(text))
+        trace = _Trace()
+        position = 0
+        while position < window.length:
+            end = self._longest_end(window, position, forward, trace)
+            if end < 0:
+                return
+            start = self._leftmost_start(window, position, end, reverse)
+            yield start, end
+            position = end
+
+    def find_all(self, text):
+        # lista dopasowanych fragmentow tekstu (jak re.findall)
+        return [text[start:end] for start, end in self.finditer(text)]
@@ -0,0 +1,16 @@
+"""
+Automaty skończone: DFA, NFA (z ε-przejściami) i operacje na nich.
+
+Import pakietu nie ma efektów ubocznych - dema zadań uruchamia `python -m automata`.
+"""
+from .DFA import DFA, DFAMatcher, import_DFA_from_file, export_DFA_to_file, code_automaton
+from .NFA import (NFA, NFAMatcher, StateLimitError, import_NFA_from_file, remove_epsilon_transitions,
+                  convert_nfa_to_dfa, convert_nfa_with_epsilon_to_dfa, union_of)
+from .LazyDFA import LazyDFA
+from .BinaryFormat import (export_DFA_to_binary, import_DFA_from_binary, export_NFA_to_binary,
+                           import_NFA_from_binary, convert_text_to_binary)
+from .Lexer import Lexer, LexerError, one_of, one_or_more
+from .MultiPattern import MultiPattern
+from .Search import Searcher
+from .Regex import RegexError, parse_regex, regex_to_nfa
+from .Instrumentation import ConstructionStats, SimulationStats
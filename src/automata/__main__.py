@@ -0,0 +1,123 @@
+"""
+Punkt wejścia: python -m automata <polecenie> (uruchamiane z katalogu z plikami danych, np. src/).
+
+- demo                         zadania 3, 4 i 5 oraz test automatu kodów pocztowych
+- determinize wej wyj          determinizacja NFA (także z ε-przejściami) do pliku DFA
+- remove-epsilon wej wyj       usunięcie ε-przejść
+- accepts plik napis...        sprawdzenie napisów automatem z pliku
+- to-binary wej wyj            konwersja pliku tekstowego do formatu binarnego
+- regex wzorzec wyj            wyrażenie regularne -> minimalny DFA w pliku
+"""
+import argparse
+import json
+import os
+import sys
+
+from .DFA import code_automaton, export_DFA_to_file
+from .NFA import (import_NFA_from_file, remove_epsilon_transitions, convert_nfa_to_dfa,
+                  convert_nfa_with_epsilon_to_dfa)
+from .BinaryFormat import convert_text_to_binary
+from .Regex import regex_to_nfa
+from .Instrumentation import ConstructionStats, SimulationStats
+
+
+def demo():
+    """ Całość determinizacji nfa (zadanie 5) """
+    convert_nfa_with_epsilon_to_dfa("nfa4.txt")
+
+    """ Samo zadanie 3 """
+    convert_nfa_to_dfa("nfa3.txt", "dfa3.txt")
+
+    """ Samo zadanie 4 """
+    remove_epsilon_transitions("nfa4.txt", "nfa_no_eps.txt")
+
+    imported_nfa = import_NFA_from_file("nfa4.txt")
+
+    # True
+    print(imported_nfa.accepts("00.23"))
+    print(imported_nfa.accepts("+5.2"))
+    print(imported_nfa.accepts("-3"))
+    print(imported_nfa.accepts("3.6534"))
+    print(imported_nfa.accepts("-265.6705"))
+    print(imported_nfa.accepts("79.123"))
+    print(imported_nfa.accepts("3445"))
+
+    # False
+    print(imported_nfa.accepts("."))
+    print(imported_nfa.accepts("+."))
+    print(imported_nfa.accepts("abc"))
+
+    if os.path.exists("dfa_kody_pocztowe.txt"):
+        dfa = code_automaton()
+
+        print(dfa.accepts("61-909")) # True
+        print(dfa.accepts("22-340")) # True
+        print(dfa.accepts("00-000")) # True
+        print(dfa.accepts("99-999")) # True
+
+        print(dfa.accepts("612909")) # False
+        print(dfa.accepts("61-90")) # False
+        print(dfa.accepts("000-000")) # False
+        print(dfa.accepts("")) # False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m automata", description="Automaty skończone")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("demo", help="zadania 3, 4, 5 i automat kodów pocztowych")
+
+    determinize = commands.add_parser("determinize", help="determinizacja NFA do pliku DFA")
+    determinize.add_argument("input")
+    determinize.add_argument("output")
+    determinize.add_argument("--minimize", action="store_true", help="minimalizacja Hopcrofta wyniku")
+    determinize.add_argument("--max-states", type=int, default=None, help="limit stanów DFA")
+    determinize.add_argument("--trim", action="store_true", help="usunięcie stanów zbędnych")
+    determinize.add_argument("--stats", action="store_true", help="liczniki determinizacji (JSON na stderr)")
+
+    remove_epsilon = commands.add_parser("remove-epsilon", help="usunięcie ε-przejść")
+    remove_epsilon.add_argument("input")
+    remove_epsilon.add_argument("output")
+    remove_epsilon.add_argument("--trim", action="store_true", help="usunięcie stanów zbędnych")
+
+    accepts = commands.add_parser("accepts", help="sprawdzenie napisów automatem z pliku")
+    accepts.add_argument("automaton")
+    accepts.add_argument("strings", nargs="+")
+    accepts.add_argument("--stats", action="store_true", help="liczby aktywnych stanów na pozycjach")
+
+    to_binary = commands.add_parser("to-binary", help="konwersja pliku tekstowego do binarnego")
+    to_binary.add_argument("input")
+    to_binary.add_argument("output")
+
+    regex = commands.add_parser("regex", help="wyrażenie regularne -> minimalny DFA w pliku")
+    regex.add_argument("pattern")
+    regex.add_argument("output")
+
+    args = parser.parse_args(argv)
+    if args.command == "demo":
+        demo()
+    elif args.command == "determinize":
+        stats = ConstructionStats() if args.stats else None
+        try:
+            convert_nfa_to_dfa(args.input, args.output, args.max_states, args.minimize, args.trim, stats)
+        finally:
+            if stats is not None:
+                print(json.dumps(stats.as_dict()), file=sys.stderr)
+    elif args.command == "remove-epsilon":
+        remove_epsilon_transitions(args.input, args.output, args.trim)
+    elif args.command == "accepts":
+        nfa = import_NFA_from_file(args.automaton)
+        for string in args.strings:
+            stats = SimulationStats() if args.stats else None
+            print(f"{nfa.accepts(string, stats)}  <->  {string}")
+            if stats is not None:
+                print(f"    aktywne stany: {stats.active_states}")
+    elif args.command == "to-binary":
+        print(convert_text_to_binary(args.input, args.output))
+    elif args.command == "regex":
+        export_DFA_to_file(regex_to_nfa(args.pattern).to_dfa(minimize=True), args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+SRC = os.path.join(ROOT, "src")
+GRAMMARS = os.path.join(ROOT, "Grammars")
+
+# pakiet automata i skrypty gramatyk nie sa instalowane - testy korzystaja z drzewa
+for path in (SRC, GRAMMARS):
+    if path not in sys.path:
+        sys.path.insert(0, path)
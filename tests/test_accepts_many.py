@@ -0,0 +1,91 @@
+import os
+import random
+import sys
+
+import pytest
+
+from automata import DFA, code_automaton
+from conftest import SRC
+
+numpy = pytest.importorskip("numpy")
+
+POSTAL_CODES = ["61-909", "00-000", "", "6", "61-90", "61-9090", "612909", "61-9o9", "\x00", "a1-111",
+                "61–909", "Ω", "99-999", "61-909 ", " 61-909", "ż0-000", "0" * 100]
+
+
+def check(dfa, strings):
+    expected = [dfa.accepts(string) for string in strings]
+    result = dfa.accepts_many(strings)
+    assert isinstance(result, numpy.ndarray) and result.dtype == bool
+    assert result.tolist() == expected
+    return expected
+
+
+def counter_dfa(number_of_states):
+    # licznik modulo number_of_states po 'a', mieszanie stanow po 'b'; koncowe co piaty
+    dfa = DFA()
+    for _ in range(number_of_states):
+        dfa.add_state()
+    dfa.mark_as_initial(0)
+    for state in range(number_of_states):
+        dfa.add_transition(state, 'a', (state + 1) % number_of_states)
+        dfa.add_transition(state, 'b', (state * 7 + 3) % number_of_states)
+        if state % 5 == 0:
+            dfa.mark_as_final(state)
+    return dfa
+
+
+def test_postal_codes_match_scalar_accepts():
+    dfa = code_automaton(os.path.join(SRC, "dfa_kody_pocztowe.txt"))
+    expected = check(dfa, POSTAL_CODES)
+    assert True in expected and False in expected
+    # napisy spoza latin-1 w partii wymuszaja pakowanie wiersz po wierszu
+    check(dfa, [code for code in POSTAL_CODES if code.isascii()])
+    assert dfa.accepts_many([]).tolist() == []
+    assert dfa.accepts_many([""]).tolist() == [dfa.accepts("")]
+
+
+def test_variable_lengths_on_small_dfa():
+    rng = random.Random(3)
+    dfa = counter_dfa(7)
+    strings = ["".join(rng.choice("abc") for _ in range(rng.randint(0, 30))) for _ in range(500)]
+    check(dfa, strings)
+
+
+def test_more_than_255_states_uses_wide_table():
+    rng = random.Random(4)
+    dfa = counter_dfa(300)
+    strings = ["a" * 300, "a" * 305, "", "b" * 40] + \
+        ["".join(rng.choice("ab") for _ in range(rng.randint(0, 700))) for _ in range(300)]
+    expected = check(dfa, strings)
+    assert dfa._batch_table[0].dtype == numpy.uint32
+    assert True in expected and False in expected
+
+
+def test_many_symbol_classes_and_non_latin1_alphabet():
+    # 300 symboli spoza latin-1, kazdy w innej klasie - macierz symboli uint32; symbol i
+    # prowadzi ze stanu 0 do i + 1, a stamtad tylko ten sam symbol wraca do 0
+    dfa = DFA()
+    for _ in range(301):
+        dfa.add_state()
+    dfa.mark_as_initial(0)
+    for index in range(300):
+        symbol = chr(0x100 + index)
+        dfa.add_transition(0, symbol, index + 1)
+        dfa.add_transition(index + 1, symbol, 0)
+        if index % 2 == 0:
+            dfa.mark_as_final(index + 1)
+    rng = random.Random(5)
+    alphabet = [chr(0x100 + index) for index in range(4)] + ['x']
+    strings = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 7))) for _ in range(400)]
+    expected = check(dfa, strings)
+    assert dfa._number_of_classes == 300
+    assert True in expected and False in expected
+
+
+def test_without_numpy_falls_back_to_accepts(monkeypatch):
+    dfa_module = sys.modules["automata.DFA"]
+    monkeypatch.setattr(dfa_module, "numpy", None)
+    monkeypatch.setattr(dfa_module, "_numpy_checked", True)
+    dfa = code_automaton(os.path.join(SRC, "dfa_kody_pocztowe.txt"))
+    assert dfa.accepts_many(POSTAL_CODES) == [dfa.accepts(code) for code in POSTAL_CODES]
@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+import ArithmeticsMethods
+import BatchCheck
+import PolishMethods
+from conftest import GRAMMARS
+
+MODULES = [("arithmetics", ArithmeticsMethods), ("polish", PolishMethods)]
+
+
+def load(name, module):
+    grammar = module.readGrammar(os.path.join(GRAMMARS, f"grammar_{name}.txt"))
+    sentences = module.readSentences(os.path.join(GRAMMARS, f"sentences_{name}.txt"))
+    return grammar, sentences
+
+
+@pytest.mark.parametrize("engine", ["native", "nltk"])
+@pytest.mark.parametrize("name, module", MODULES)
+def test_parallel_matches_in_process(monkeypatch, name, module, engine):
+    if engine == "nltk":
+        pytest.importorskip("nltk")
+    grammar, sentences = load(name, module)
+    sentences = sentences * 5
+    expected = [module.canGenerateByCFG(grammar, sentence, engine) for sentence in sentences]
+    assert True in expected and False in expected
+
+    # pula procesow takze dla malego wejscia
+    monkeypatch.setattr(BatchCheck, "MIN_PARALLEL", 1)
+    assert module.checkSentences(grammar, sentences, workers=1, engine=engine) == expected
+    assert module.checkSentences(grammar, sentences, workers=2, engine=engine) == expected
@@ -0,0 +1,61 @@
+import os
+
+from automata import (code_automaton, export_DFA_to_binary, export_NFA_to_binary, import_DFA_from_binary,
+                      import_NFA_from_binary, import_NFA_from_file)
+from conftest import SRC
+
+POSTAL_CODES = ["61-909", "00-000", "612909", "61-90", "", "99-999", "a1-111"]
+
+
+def test_dfa_round_trip_uses_file_in_place(tmp_path):
+    dfa = code_automaton(os.path.join(SRC, "dfa_kody_pocztowe.txt"))
+    file = str(tmp_path / "kody.fsab")
+    export_DFA_to_binary(dfa, file)
+
+    loaded = import_DFA_from_binary(file)
+    assert isinstance(loaded._final_flags, memoryview)
+    for code in POSTAL_CODES:
+        assert loaded.accepts(code) == dfa.accepts(code)
+    assert loaded.is_final_state(6) == dfa.is_final_state(6)
+    # dopasowanie nie wymaga odtwarzania slownika przejsc ani zbioru stanow koncowych
+    assert loaded._transitions is None and loaded._final_states is None
+
+    assert loaded.final_states == dfa.final_states
+    assert loaded.transitions == dfa.transitions
+
+
+def test_dfa_loaded_from_binary_can_be_modified(tmp_path):
+    dfa = code_automaton(os.path.join(SRC, "dfa_kody_pocztowe.txt"))
+    file = str(tmp_path / "kody.fsab")
+    export_DFA_to_binary(dfa, file)
+
+    loaded = import_DFA_from_binary(file)
+    loaded.mark_as_final(5)
+    assert loaded.accepts("61-90") and loaded.accepts("61-909")
+
+
+def test_nfa_round_trip(tmp_path):
+    nfa = import_NFA_from_file(os.path.join(SRC, "nfa4.txt"))
+    file = str(tmp_path / "nfa4.fsab")
+    export_NFA_to_binary(nfa, file)
+
+    loaded = import_NFA_from_binary(file)
+    assert loaded.final_states == nfa.final_states
+    assert loaded.transitions == nfa.transitions
+
+
+def test_assigning_final_states_or_transitions_recompiles(tmp_path):
+    dfa = code_automaton(os.path.join(SRC, "dfa_kody_pocztowe.txt"))
+    file = str(tmp_path / "kody.fsab")
+    export_DFA_to_binary(dfa, file)
+
+    for automaton in (dfa.compile(), import_DFA_from_binary(file)):
+        assert automaton.accepts("61-909")
+        transitions = dict(automaton.transitions)
+        automaton.final_states = set()
+        assert not automaton.accepts("61-909") and not automaton.is_final_state(6)
+        automaton.final_states = {6}
+        automaton.transitions = {}
+        assert not automaton.accepts("61-909")
+        automaton.transitions = transitions
+        assert automaton.accepts("61-909") and automaton.is_final_state(6)
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+
+from conftest import GRAMMARS, SRC
+
+IMPORT_TIME_LIMIT = 0.5  # sekundy, z duzym zapasem - sam import trwa kilka ms
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import automata
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "numpy": "numpy" in sys.modules}))
+"""
+
+GRAMMAR_SCRIPT = """
+import json, multiprocessing, sys
+before = list(sys.path)
+import ArithmeticsMethods, BatchCheck
+grammar = ArithmeticsMethods.readGrammar("grammar_arithmetics.txt")
+# pula procesow uruchamianych od zera (spawn) takze musi znalezc lekser
+multiprocessing.set_start_method("spawn")
+BatchCheck.MIN_PARALLEL = 1
+print(json.dumps({"path_changed": sys.path != before,
+                  "tokens": ArithmeticsMethods.tokenize("(1 + 2) * 3"),
+                  "results": [ArithmeticsMethods.canGenerateByCFG(grammar, "1 + 2 * 3"),
+                              ArithmeticsMethods.canGenerateByCFG(grammar, "1 + + 2"),
+                              ArithmeticsMethods.canGenerateByCFG(grammar, "1 ? 2")],
+                  "parallel": ArithmeticsMethods.checkSentences(grammar, ["1 + 2", "1 +", "(3)"], workers=2)}))
+"""
+
+
+def data_files():
+    return {name: os.stat(os.path.join(SRC, name)).st_mtime_ns
+            for name in os.listdir(SRC) if name.endswith(".txt")}
+
+
+def test_import_has_no_side_effects(tmp_path):
+    before = data_files()
+    environment = dict(os.environ, PYTHONPATH=SRC, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run([sys.executable, "-c", SCRIPT], cwd=tmp_path, env=environment,
+                            capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+
+    assert list(tmp_path.iterdir()) == []
+    assert data_files() == before
+    assert not report["numpy"]
+    assert report["elapsed"] < IMPORT_TIME_LIMIT
+
+
+def test_grammar_module_runs_from_its_directory():
+    # tak, jak uzywa go uzytkownik: z katalogu Grammars/, bez PYTHONPATH i instalacji pakietu
+    environment = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    environment.pop("PYTHONPATH", None)
+    result = subprocess.run([sys.executable, "-c", GRAMMAR_SCRIPT], cwd=GRAMMARS, env=environment,
+                            capture_output=True, text=True, check=True)
+    report = json.loads(result.stdout)
+
+    assert not report["path_changed"]
+    assert report["tokens"] == ["(", "NUM", "+", "NUM", ")", "*", "NUM"]
+    assert report["results"] == [True, False, False]
+    assert report["parallel"] == [True, False, True]
+
+    script = subprocess.run([sys.executable, "ArithmeticsMethods.py"], cwd=GRAMMARS, env=environment,
+                            capture_output=True, text=True, check=True)
+    lines = script.stdout.splitlines()
+    assert len(lines) == len(open(os.path.join(GRAMMARS, "sentences_arithmetics.txt")).read().splitlines())
+    assert lines[0].startswith("1. ")
@@ -0,0 +1,38 @@
+import itertools
+import os
+
+import pytest
+
+from automata import import_DFA_from_file, import_NFA_from_file
+from conftest import SRC
+
+DFA_FILES = ["dfa3.txt", "dfa5.txt"]
+NFA_FILES = ["nfa3.txt", "nfa4.txt", "nfa_no_eps.txt"]
+
+
+def sample_strings(dfa, max_length=4):
+    alphabet = sorted({character for (_, character) in dfa.transitions})
+    for length in range(max_length + 1):
+        for characters in itertools.product(alphabet, repeat=length):
+            yield "".join(characters)
+
+
+def check_minimal(dfa, accepts):
+    minimal = dfa.minimize()
+    assert minimal.is_equivalent(dfa)
+    assert minimal.number_of_states <= dfa.number_of_states
+    assert minimal.minimize().number_of_states == minimal.number_of_states
+    for string in sample_strings(dfa):
+        assert minimal.accepts(string) == accepts(string), string
+
+
+@pytest.mark.parametrize("file", DFA_FILES)
+def test_minimize_sample_dfa(file):
+    dfa = import_DFA_from_file(os.path.join(SRC, file))
+    check_minimal(dfa, dfa.accepts)
+
+
+@pytest.mark.parametrize("file", NFA_FILES)
+def test_minimize_determinized_sample_nfa(file):
+    nfa = import_NFA_from_file(os.path.join(SRC, file))
+    check_minimal(nfa.to_dfa(), nfa.accepts)
@@ -0,0 +1,89 @@
+import itertools
+import os
+
+import pytest
+
+import ArithmeticsMethods
+import PolishMethods
+from CompiledGrammar import CompiledGrammar
+from conftest import GRAMMARS
+from NativeGrammar import NativeGrammar, parseGrammar
+
+MAX_LENGTH = 6
+
+# gramatyki z regulami pustymi i jednostkowymi (takze cyklami jednostkowymi), wymazywalnym
+# startem, startem po prawej stronie i dlugimi prawymi stronami - kazdy krok toCNF
+SMALL_GRAMMARS = [
+    "S -> A B | 'x'\nA -> 'a' A |\nB -> 'b' | A",
+    "S -> S S | '(' S ')' |",
+    "S -> A | 'c'\nA -> B | 'a' S 'b'\nB -> S |",
+    "S -> 'a' N N 'b' N\nN -> 'c' |",
+    "S -> E\nE -> E '+' T | T\nT -> T '*' F | F\nF -> '(' E ')' | 'n'",
+    "S -> A\nA -> B\nB -> 'b' B | 'b'\nC -> 'c'",
+]
+
+
+def language(grammar_str, max_length):
+    # wszystkie ciagi terminali dlugosci <= max_length wyprowadzalne z symbolu startowego,
+    # liczone punktem stalym bez zadnej normalizacji gramatyki
+    start, rules = parseGrammar(grammar_str)
+    words = {lhs: set() for lhs, _ in rules}
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in rules:
+            current = {()}
+            for symbol in rhs:
+                options = {(symbol[1],)} if isinstance(symbol, tuple) else words.get(symbol, set())
+                current = {prefix + suffix for prefix in current for suffix in options
+                           if len(prefix) + len(suffix) <= max_length}
+            if not current <= words[lhs]:
+                words[lhs] |= current
+                changed = True
+    return start, rules, words[start]
+
+
+@pytest.mark.parametrize("grammar_str", SMALL_GRAMMARS)
+def test_cyk_and_earley_match_brute_force(grammar_str):
+    _, rules, expected = language(grammar_str, MAX_LENGTH)
+    terminals = sorted({symbol[1] for _, rhs in rules for symbol in rhs if isinstance(symbol, tuple)})
+    grammar = NativeGrammar(grammar_str)
+    for length in range(MAX_LENGTH + 1):
+        for tokens in itertools.product(terminals, repeat=length):
+            assert grammar.cyk(list(tokens)) == (tokens in expected), tokens
+            assert grammar.earley(list(tokens)) == (tokens in expected), tokens
+    assert not grammar.cyk(["?"]) and not grammar.earley(["?"])
+
+
+@pytest.mark.parametrize("name, module, tokenize", [
+    ("arithmetics", ArithmeticsMethods, ArithmeticsMethods.tokenize),
+    ("polish", PolishMethods, str.split),
+])
+def test_engines_agree_on_sentence_files(name, module, tokenize):
+    grammar_str = module.readGrammar(os.path.join(GRAMMARS, f"grammar_{name}.txt"))
+    sentences = module.readSentences(os.path.join(GRAMMARS, f"sentences_{name}.txt"))
+    grammar = NativeGrammar(grammar_str)
+    try:
+        nltk_grammar = CompiledGrammar(grammar_str)
+    except ImportError:
+        nltk_grammar = None
+
+    results = []
+    for sentence in sentences:
+        expected = module.canGenerateByCFG(grammar_str, sentence)
+        try:
+            tokens = tokenize(sentence)
+        except ValueError:
+            assert not expected
+            continue
+        assert grammar.cyk(tokens) == expected, sentence
+        assert grammar.earley(tokens) == expected, sentence
+        if nltk_grammar is not None:
+            try:
+                assert nltk_grammar.recognizes(tokens) == expected, sentence
+            except ValueError:
+                # token spoza gramatyki
+                assert not expected
+            assert module.canGenerateByCFG(grammar_str, sentence, "nltk") == expected, sentence
+        results.append(expected)
+    assert True in results and False in results
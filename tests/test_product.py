@@ -0,0 +1,110 @@
+import itertools
+import os
+
+import pytest
+
+from automata import import_DFA_from_file, import_NFA_from_file, regex_to_nfa
+from conftest import SRC
+
+MAX_STRINGS = 5000
+
+
+def sample(name):
+    # automat z pliku w src/ (NFA determinizowany) albo z wyrazenia regularnego
+    if name.endswith(".txt"):
+        if name.startswith("dfa"):
+            return import_DFA_from_file(os.path.join(SRC, name))
+        return import_NFA_from_file(os.path.join(SRC, name)).to_dfa()
+    return regex_to_nfa(name).to_dfa()
+
+
+BINARY = ["dfa3.txt", "nfa3.txt", "(0|1)*1", "1*0?", "(00|11)*"]
+DECIMAL = ["dfa5.txt", "nfa4.txt", "nfa_no_eps.txt", "[+-]?[0-9]+", "[0-9]*\\.[0-9]+"]
+PAIRS = list(itertools.combinations(BINARY, 2)) + list(itertools.combinations(DECIMAL, 2)) + \
+    [(first, first) for first in BINARY + DECIMAL] + [("dfa3.txt", "dfa5.txt"), ("(0|1)*1", "[+-]?[0-9]+")]
+
+
+def all_strings(alphabet):
+    # wszystkie napisy nad alfabetem w kolejnosci dlugosci, do MAX_STRINGS napisow;
+    # zwraca (napisy, najwieksza w pelni sprawdzona dlugosc)
+    strings = []
+    length = 0
+    while len(strings) + len(alphabet) ** length <= MAX_STRINGS:
+        strings.extend("".join(characters) for characters in itertools.product(alphabet, repeat=length))
+        length += 1
+    return strings, length - 1
+
+
+@pytest.mark.parametrize("first_name, second_name", PAIRS)
+def test_operations_match_brute_force(first_name, second_name):
+    first, second = sample(first_name), sample(second_name)
+    alphabet = sorted(first._alphabet() | second._alphabet())
+    strings, _ = all_strings(alphabet)
+    operations = {
+        "intersection": (lambda a, b: a and b, first.intersection(second), first.intersection(second, trim=True)),
+        "union": (lambda a, b: a or b, first.union(second), first.union(second, trim=True)),
+        "difference": (lambda a, b: a and not b, first.difference(second), first.difference(second, trim=True)),
+    }
+    for name, (accept, product, trimmed) in operations.items():
+        expected = [accept(first.accepts(string), second.accepts(string)) for string in strings]
+        assert [product.accepts(string) for string in strings] == expected, name
+        assert [trimmed.accepts(string) for string in strings] == expected, name
+        if any(expected):
+            assert not product.is_empty() and not trimmed.is_empty(), name
+        if product.is_empty():
+            assert not any(expected), name
+        assert product.is_empty() == trimmed.is_empty()
+
+    complement = first.complement(alphabet)
+    assert all(complement.accepts(string) != first.accepts(string) for string in strings)
+
+
+@pytest.mark.parametrize("first_name, second_name", PAIRS)
+def test_counterexample_is_shortest(first_name, second_name):
+    first, second = sample(first_name), sample(second_name)
+    alphabet = sorted(first._alphabet() | second._alphabet())
+    strings, checked_length = all_strings(alphabet)
+    shortest = next((string for string in strings if first.accepts(string) != second.accepts(string)), None)
+
+    counterexample = first.find_counterexample(second)
+    if shortest is not None:
+        assert counterexample is not None
+        assert len(counterexample) == len(shortest)
+        assert first.accepts(counterexample) != second.accepts(counterexample)
+        assert not first.is_equivalent(second)
+    elif counterexample is not None:
+        # dluzszy niz wszystkie sprawdzone napisy
+        assert len(counterexample) > checked_length
+        assert first.accepts(counterexample) != second.accepts(counterexample)
+    reverse = second.find_counterexample(first)
+    assert (reverse is None) == (counterexample is None)
+    if reverse is not None:
+        assert len(reverse) == len(counterexample)
+
+
+@pytest.mark.parametrize("name", BINARY + DECIMAL)
+def test_equivalent_rebuilds(name):
+    dfa = sample(name)
+    assert dfa.is_equivalent(dfa.minimize())
+    assert dfa.is_equivalent(dfa.trim())
+    assert dfa.difference(dfa).is_empty()
+    assert dfa.intersection(dfa.complement(dfa._alphabet())).is_empty()
+
+
+def test_counterexample_after_changing_one_state():
+    # przebudowany automat z jednym stanem koncowym mniej rozni sie na najkrotszym slowie,
+    # ktore konczy sie w tym stanie
+    dfa = sample("dfa5.txt")
+    changed = sample("dfa5.txt")
+    removed = max(changed.final_states)
+    changed.final_states = changed.final_states - {removed}
+    counterexample = dfa.find_counterexample(changed)
+    assert dfa.accepts(counterexample) and not changed.accepts(counterexample)
+    strings, _ = all_strings(sorted(dfa._alphabet()))
+    shortest = next(string for string in strings if dfa.accepts(string) != changed.accepts(string))
+    assert len(counterexample) == len(shortest)
+
+
+def test_complement_rejects_symbols_outside_alphabet():
+    with pytest.raises(ValueError):
+        sample("dfa5.txt").complement("0123456789")
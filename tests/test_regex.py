@@ -0,0 +1,63 @@
+import itertools
+import re
+
+import pytest
+
+from automata import RegexError, regex_to_nfa
+from automata.Regex import MAX_REPEAT
+
+
+@pytest.mark.parametrize("pattern", [
+    'a*b', '(a|b)*abb', 'a{2,3}', '(ab){1,}c?', '[a-c]+x', '[^ab]', 'a.b', '', 'a|', '(a|)*b+',
+    '[a\\-]z', 'x{0,2}y{3}', '((a|b){2})*', '[]a]',
+])
+def test_agrees_with_re(pattern):
+    nfa = regex_to_nfa(pattern)
+    assert not any(symbol is None for _, symbol in nfa.transitions)
+    dfa = nfa.to_dfa()
+    for length in range(5):
+        for characters in itertools.product('abcxyz-]', repeat=length):
+            string = "".join(characters)
+            expected = re.fullmatch(pattern, string) is not None
+            assert nfa.accepts(string) == expected == dfa.accepts(string), (pattern, string)
+
+
+def test_max_repeat_count():
+    nfa = regex_to_nfa(f"a{{{MAX_REPEAT}}}")
+    assert nfa.accepts("a" * MAX_REPEAT)
+    assert not nfa.accepts("a" * (MAX_REPEAT - 1))
+
+
+def test_bounded_repeat_up_to_max():
+    nfa = regex_to_nfa(f"a{{0,{MAX_REPEAT}}}")
+    assert nfa.accepts("")
+    assert nfa.accepts("a" * MAX_REPEAT)
+    assert not nfa.accepts("a" * (MAX_REPEAT + 1))
+
+
+def test_long_literal():
+    literal = "abc" * 1000
+    nfa = regex_to_nfa(literal)
+    assert nfa.accepts(literal)
+    assert not nfa.accepts(literal[:-1])
+
+
+def test_long_alternation():
+    nfa = regex_to_nfa("|".join(f"x{i}" for i in range(2000)))
+    assert nfa.accepts("x1999")
+    assert not nfa.accepts("x2000")
+
+
+@pytest.mark.parametrize("pattern, position", [
+    ('(a', 0), ('a)', 1), ('*a', 0), ('a{3,1}', 1), ('[a', 0), ('a{', 2), ('\\q', 0),
+    ('[z-a]', 0), (f'a{{{MAX_REPEAT + 1}}}', 1),
+])
+def test_syntax_errors_report_position(pattern, position):
+    with pytest.raises(RegexError) as error:
+        regex_to_nfa(pattern)
+    assert error.value.position == position
+
+
+def test_deep_nesting_is_a_syntax_error():
+    with pytest.raises(RegexError):
+        regex_to_nfa("(" * 5000 + "a" + ")" * 5000)
@@ -0,0 +1,97 @@
+import mmap
+import random
+
+from automata import Searcher, regex_to_nfa
+
+
+class CountingText(str):
+    # napis liczacy przeczytane znaki (takze w wycinkach)
+    reads = 0
+
+    def __getitem__(self, index):
+        result = str.__getitem__(self, index)
+        CountingText.reads += len(result)
+        return result
+
+
+def brute_force(nfa, text):
+    dfa = nfa.to_dfa()
+    matches = []
+    position = 0
+    while position < len(text):
+        best = -1
+        for end in range(position + 1, len(text) + 1):
+            if dfa.accepts(text[position:end]):
+                best = end
+        if best > 0:
+            matches.append((position, best))
+            position = best
+        else:
+            position += 1
+    return matches
+
+
+def test_matches_brute_force():
+    rng = random.Random(1)
+    atoms = ['a', 'b', 'c', '[ab]', '.', 'a*', '(ab|c)', 'b+', 'c?']
+    for _ in range(200):
+        pattern = "".join(rng.choice(atoms) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            pattern += '|' + rng.choice(atoms)
+        nfa = regex_to_nfa(pattern)
+        text = "".join(rng.choice('abcx') for _ in range(rng.randint(0, 25)))
+        searcher = Searcher(nfa)
+        expected = brute_force(nfa, text)
+        assert list(searcher.finditer(text)) == expected, (pattern, text)
+        assert list(searcher.finditer(text.encode())) == expected, (pattern, text)
+
+
+def test_leftmost_match_ending_after_an_earlier_one():
+    # "c" konczy sie wczesniej, ale "abcd" zaczyna sie bardziej na lewo
+    searcher = Searcher(regex_to_nfa("abcd|c"))
+    assert list(searcher.finditer("xabcdc")) == [(1, 5), (5, 6)]
+    assert list(Searcher(regex_to_nfa("abcde|cdefgh")).finditer("abcdefgh")) == [(0, 5)]
+
+
+def test_matches_across_chunks(monkeypatch):
+    import automata.Search
+    monkeypatch.setattr(automata.Search, "CHUNK", 3)
+    nfa = regex_to_nfa("ab*c|b")
+    text = "xabbbbbbcbbab" * 3
+    assert list(Searcher(nfa).finditer(text)) == brute_force(nfa, text)
+    nfa = regex_to_nfa("a*b|a")
+    text = "a" * 50 + "b" + "a" * 40
+    assert list(Searcher(nfa).finditer(text)) == brute_force(nfa, text)
+
+
+def test_state_cache_overflow(monkeypatch):
+    # wzorzec, dla ktorego Σ*·R ma wiele stanow; cache czyszczony w trakcie przeszukania
+    import automata.Search
+    monkeypatch.setattr(automata.Search, "MAX_CACHED_STATES", 8)
+    rng = random.Random(2)
+    nfa = regex_to_nfa("a[ab][ab][ab]b|(ab)*a")
+    text = "".join(rng.choice("ab") for _ in range(300))
+    assert list(Searcher(nfa).finditer(text)) == brute_force(nfa, text)
+
+
+def test_mmap_input(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"kod 61-909, potem 00-950 i 1-234\n" * 100)
+    searcher = Searcher(regex_to_nfa(r"\d\d-\d\d\d"))
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        matches = searcher.find_all(data)
+        assert len(matches) == 200
+        assert set(matches) == {b"61-909", b"00-950"}
+        assert list(searcher.finditer(memoryview(data))) == list(searcher.finditer(data))
+
+
+def test_pathological_pattern_reads_each_character_at_most_twice():
+    # a*b|a na tekscie z samych 'a': kazde dopasowanie to jedno 'a', a watek szukajacy
+    # 'b' zyje do konca tekstu - przebieg zaczynany od konca kazdego dopasowania, bez
+    # zapamietanych stanow, czytalby tekst kwadratowo wiele razy
+    searcher = Searcher(regex_to_nfa("a*b|a"))
+    for length in (1000, 4000, 16000):
+        CountingText.reads = 0
+        matches = list(searcher.finditer(CountingText("a" * length)))
+        assert len(matches) == length
+        assert CountingText.reads <= 2 * length